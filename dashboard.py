@@ -2,23 +2,25 @@
 Flask Dashboard for viewing scraped Haraj listings
 """
 
-from flask import Flask, render_template, jsonify, send_file, request, make_response
+from flask import Flask, render_template, jsonify, send_file, request, make_response, Response
+import functools
+import hashlib
 import json
+import mmap
 import os
 import re
 from pathlib import Path
-import csv
-import io
 import threading
-import time
-import subprocess
-import sys
+from collections import Counter
 from urllib.parse import quote
 
+# csv/io/time/requests and the Selenium scraper are imported inside the handlers that
+# use them so read-only requests don't pay for them at cold start.
+
 try:
-    import requests
+    import orjson
 except ImportError:
-    requests = None
+    orjson = None
 
 # Get the directory where this script is located
 _script_dir = Path(__file__).parent.absolute()
@@ -28,6 +30,34 @@ BASE_DIR = _script_dir
 _template_dir = BASE_DIR / "templates"
 app = Flask(__name__, template_folder=str(_template_dir))
 
+if orjson is not None:
+    from flask.json.provider import DefaultJSONProvider
+
+    class OrjsonJSONProvider(DefaultJSONProvider):
+        """JSON provider backed by orjson, so every jsonify() response is serialized in C straight to bytes."""
+
+        # Key order carries no meaning for the API clients; skip the sort on large payloads
+        sort_keys = False
+
+        def _options(self, sort_keys=None):
+            option = orjson.OPT_NON_STR_KEYS
+            if self.sort_keys if sort_keys is None else sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            return option
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default, option=self._options(kwargs.get('sort_keys'))).decode('utf-8')
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+        def response(self, *args, **kwargs):
+            obj = self._prepare_response_obj(args, kwargs)
+            body = orjson.dumps(obj, default=self.default, option=self._options())
+            return self._app.response_class(body, mimetype=self.mimetype)
+
+    app.json = OrjsonJSONProvider(app)
+
 # Data paths: use env vars in production so you can point to a persistent volume
 _data_dir_env = os.environ.get("HARAJ_DATA_DIR") or os.environ.get("DATA_DIR")
 _config_env = os.environ.get("HARAJ_CONFIG_FILE") or os.environ.get("CONFIG_FILE")
@@ -35,6 +65,18 @@ DATA_DIR = Path(_data_dir_env) if _data_dir_env else (BASE_DIR / "scraped_data")
 CONFIG_FILE = Path(_config_env) if _config_env else (BASE_DIR / "scraper_config.json")
 SAVED_LISTINGS_FILE = DATA_DIR / "saved_listings.json"
 LISTINGS_DB = DATA_DIR / "listings.db"
+STATS_FILE = DATA_DIR / "stats.json"
+
+# WhatsApp link -> phone number (wa.me/966501234567 or whatsapp://send?phone=966501234567)
+WHATSAPP_RE = re.compile(r'(?:wa\.me/|whatsapp.*phone=)(\d+)')
+# script/code fragments stripped from scraped titles and descriptions
+_SCRIPT_CODE_RE = re.compile(
+    r'<script[\s\S]*?</script>|document\.write\s*\(|window\.onload\s*='
+    r'|parent\.postMessage\s*\(|function\s*\([^)]*\)\s*\{|<iframe[\s\S]*?</iframe>'
+    r'|javascript:|\.style\.\w+\s*=',
+    re.IGNORECASE | re.DOTALL,
+)
+_WHITESPACE_RE = re.compile(r'\s+')
 
 # Haraj.com.sa – scrape leads from https://haraj.com.sa/ (exact tag names from site)
 HARAJ_SITE = "https://haraj.com.sa"
@@ -73,13 +115,23 @@ def get_categories_with_urls():
     ]
 
 
-# Create data directory if it doesn't exist
-try:
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-except:
-    pass  # Continue even if directory creation fails
+# Data/config directories are created once per process by _ensure_init() (called by the writers and warm_up())
+_INIT_DONE = False
+
 
-# Scraping status
+def _ensure_init():
+    """Create the data and config directories once; later calls are a no-op (no per-request mkdir)."""
+    global _INIT_DONE
+    if _INIT_DONE:
+        return
+    for directory in (DATA_DIR, CONFIG_FILE.parent):
+        try:
+            directory.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            pass  # Continue even if directory creation fails (e.g. read-only filesystem)
+    _INIT_DONE = True
+
+# Scraping status (owned by the scraper process; web workers read it back from SCRAPING_STATUS_FILE)
 scraping_status = {
     'is_running': False,
     'progress': 0,
@@ -87,19 +139,44 @@ scraping_status = {
     'current_listing': '',
     'error': None
 }
+SCRAPING_STATUS_FILE = DATA_DIR / "scraping_status.json"
+SCRAPING_STOP_FILE = DATA_DIR / "scraping_stop"
+_scraper_process = None
+
+def _read_json_file(path):
+    """Parse a JSON file; uses orjson on the raw bytes when available."""
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _read_json_file_mapped(path):
+    """Parse a (large) JSON file by handing orjson a read-only mmap of it, avoiding a read() copy.
+    Only safe because every writer of these files swaps in a new file with os.replace(): truncating a
+    mapped file in place would SIGBUS this process."""
+    if orjson is None:
+        return _read_json_file(path)
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files can't be mapped; let orjson raise its usual decode error
+            return orjson.loads(f.read())
+        with mm, memoryview(mm) as view:
+            return orjson.loads(view)
+
 
 def load_config():
     """Load scraper configuration. OpenAI API key is stored until user adds or changes it in Settings."""
     try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                if isinstance(config, dict):
-                    return {
-                        'username': config.get('username', ''),
-                        'password': config.get('password', ''),
-                    }
-    except json.JSONDecodeError:
+        config = _read_json_file(CONFIG_FILE)
+        if isinstance(config, dict):
+            return {
+                'username': config.get('username', ''),
+                'password': config.get('password', ''),
+            }
+    except (FileNotFoundError, json.JSONDecodeError):
         pass
     except PermissionError:
         print(f"Warning: Permission denied reading config file: {CONFIG_FILE}")
@@ -110,15 +187,18 @@ def load_config():
 def save_config(config):
     """Save scraper configuration (Haraj credentials only)."""
     try:
-        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_init()
         if not isinstance(config, dict):
             return False
         payload = {
             'username': config.get('username', ''),
             'password': config.get('password', ''),
         }
-        with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-            json.dump(payload, f, indent=2)
+        if orjson is not None:
+            CONFIG_FILE.write_bytes(orjson.dumps(payload, option=orjson.OPT_INDENT_2))
+        else:
+            with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
+                json.dump(payload, f, indent=2)
         
         # Set restrictive permissions (Unix-like systems)
         try:
@@ -142,14 +222,8 @@ def _sanitize_listing_text(text, max_len=50000):
     """Remove script/code from scraped title or description for display."""
     if not text or not isinstance(text, str):
         return (text or '').strip()
-    s = text.strip()
-    for pat in [
-        r'<script[\s\S]*?</script>', r'document\.write\s*\(', r'window\.onload\s*=',
-        r'parent\.postMessage\s*\(', r'function\s*\([^)]*\)\s*\{', r'<iframe[\s\S]*?</iframe>',
-        r'javascript:', r'\.style\.\w+\s*=',
-    ]:
-        s = re.sub(pat, ' ', s, flags=re.IGNORECASE | re.DOTALL)
-    s = re.sub(r'\s+', ' ', s).strip()
+    s = _SCRIPT_CODE_RE.sub(' ', text.strip())
+    s = _WHITESPACE_RE.sub(' ', s).strip()
     return s[:max_len] if len(s) > max_len else s
 
 
@@ -175,27 +249,29 @@ def _sanitize_posted_time(posted_time, max_display_len=80):
     return ''
 
 
+def _sanitize_listing(L):
+    """Sanitize title/description/posted_time of a listing in place; returns it."""
+    if L.get('title'):
+        L['title'] = _sanitize_listing_text(L['title'], max_len=2000)
+    if L.get('description'):
+        L['description'] = _sanitize_listing_text(L['description'], max_len=50000)
+    if L.get('posted_time'):
+        L['posted_time'] = _sanitize_posted_time(L['posted_time'])
+    return L
+
+
 def load_listings():
     """Load listings from JSON file (sanitize title/description to remove script content)."""
-    json_file = DATA_DIR / "listings.json"
-    if json_file.exists():
-        with open(json_file, 'r', encoding='utf-8') as f:
-            listings = json.load(f)
-        for L in listings:
-            if L.get('title'):
-                L['title'] = _sanitize_listing_text(L['title'], max_len=2000)
-            if L.get('description'):
-                L['description'] = _sanitize_listing_text(L['description'], max_len=50000)
-            if L.get('posted_time'):
-                L['posted_time'] = _sanitize_posted_time(L['posted_time'])
-        return listings
-    return []
+    try:
+        return [_sanitize_listing(L) for L in _read_json_file_mapped(DATA_DIR / "listings.json")]
+    except FileNotFoundError:
+        return []
 
 
 def _init_listings_db():
     """Create SQLite DB and table if not exists."""
     import sqlite3
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_init()
     conn = sqlite3.connect(str(LISTINGS_DB))
     conn.execute("""
         CREATE TABLE IF NOT EXISTS listings (
@@ -234,7 +310,6 @@ def _save_saved_listings_to_db(listings):
     """Upsert all listings into SQLite."""
     import sqlite3
     import re
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
     _init_listings_db()
     conn = sqlite3.connect(str(LISTINGS_DB))
     for L in listings:
@@ -256,26 +331,13 @@ def load_saved_listings():
     listings = _load_saved_listings_from_db()
     if listings:
         for L in listings:
-            if L.get('title'):
-                L['title'] = _sanitize_listing_text(L['title'], max_len=2000)
-            if L.get('description'):
-                L['description'] = _sanitize_listing_text(L['description'], max_len=50000)
-            if L.get('posted_time'):
-                L['posted_time'] = _sanitize_posted_time(L['posted_time'])
+            _sanitize_listing(L)
         return listings
     if SAVED_LISTINGS_FILE.exists():
         try:
-            with open(SAVED_LISTINGS_FILE, 'r', encoding='utf-8') as f:
-                listings = json.load(f)
-        except (json.JSONDecodeError, IOError):
+            listings = [_sanitize_listing(L) for L in _read_json_file_mapped(SAVED_LISTINGS_FILE)]
+        except (ValueError, IOError):
             return load_listings()
-        for L in listings:
-            if L.get('title'):
-                L['title'] = _sanitize_listing_text(L['title'], max_len=2000)
-            if L.get('description'):
-                L['description'] = _sanitize_listing_text(L['description'], max_len=50000)
-            if L.get('posted_time'):
-                L['posted_time'] = _sanitize_posted_time(L['posted_time'])
         _save_saved_listings_to_db(listings)
         return listings
     return load_listings()
@@ -283,10 +345,14 @@ def load_saved_listings():
 
 def save_saved_listings(listings):
     """Persist saved listings to SQLite DB and to JSON (sync for production and backup)."""
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    _ensure_init()
     _save_saved_listings_to_db(listings)
-    with open(SAVED_LISTINGS_FILE, 'w', encoding='utf-8') as f:
+    # Replace, never rewrite in place: readers may have the old file mmapped (_read_json_file_mapped)
+    tmp = SAVED_LISTINGS_FILE.with_suffix('.tmp')
+    with open(tmp, 'w', encoding='utf-8') as f:
         json.dump(listings, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, SAVED_LISTINGS_FILE)
+    invalidate_listings_cache()
 
 
 def merge_saved_listings(new_listings):
@@ -311,48 +377,144 @@ def merge_saved_listings(new_listings):
 
 
 def get_listings_stats(listings):
-    """Calculate statistics about listings"""
-    if not listings:
-        return {
-            'total': 0,
-            'with_contact': 0,
-            'with_images': 0,
-            'with_prices': 0,
-            'cities': {},
-            'categories': {}
-        }
-    
-    stats = {
-        'total': len(listings),
-        'with_contact': 0,
-        'with_images': 0,
-        'with_prices': 0,
-        'cities': {},
-        'categories': {}
-    }
+    """Calculate statistics about listings (single pass)"""
+    cities = Counter()
+    categories = Counter()
+    with_contact = 0
+    with_images = 0
+    with_prices = 0
+    total = 0
     
     for listing in listings:
+        get = listing.get
+        total += 1
         # Contact info
-        if listing.get('contact_info', {}).get('phone_numbers'):
-            stats['with_contact'] += 1
-        
-        # Images
-        if listing.get('images'):
-            stats['with_images'] += len(listing.get('images', []))
-        
+        if (get('contact_info') or {}).get('phone_numbers'):
+            with_contact += 1
+        # Images (total image count)
+        images = get('images')
+        if images:
+            with_images += len(images)
         # Prices
-        if listing.get('price'):
-            stats['with_prices'] += 1
-        
-        # Cities
-        city = listing.get('city', 'Unknown')
-        stats['cities'][city] = stats['cities'].get(city, 0) + 1
-        
-        # Categories
-        category = listing.get('category', 'Unknown')
-        stats['categories'][category] = stats['categories'].get(category, 0) + 1
+        if get('price'):
+            with_prices += 1
+        cities[get('city', 'Unknown')] += 1
+        categories[get('category', 'Unknown')] += 1
     
-    return stats
+    return {
+        'total': total,
+        'with_contact': with_contact,
+        'with_images': with_images,
+        'with_prices': with_prices,
+        'cities': dict(cities),
+        'categories': dict(categories)
+    }
+
+
+# In-memory cache of saved listings + stats; reloaded only when the backing files change
+_LISTINGS_CACHE = {'key': None, 'data': [], 'stats': {}, 'by_id': {}, 'payload': None}
+_LISTINGS_CACHE_LOCK = threading.Lock()
+
+
+def _file_key(path):
+    """Return (mtime_ns, size) for path, or None if it does not exist."""
+    try:
+        st = path.stat()
+        return (st.st_mtime_ns, st.st_size)
+    except OSError:
+        return None
+
+
+def _listings_cache_key():
+    """Cache key covering every file load_saved_listings() may read from."""
+    return (
+        _file_key(LISTINGS_DB),
+        _file_key(SAVED_LISTINGS_FILE),
+        _file_key(DATA_DIR / "listings.json"),
+    )
+
+
+def get_cached():
+    """Return (listings, stats) for saved listings. Same objects are returned until the data files change; treat as read-only."""
+    key = _listings_cache_key()
+    with _LISTINGS_CACHE_LOCK:
+        if _LISTINGS_CACHE['key'] != key:
+            listings = load_saved_listings()
+            _LISTINGS_CACHE['data'] = listings
+            _LISTINGS_CACHE['stats'] = get_listings_stats(listings)
+            by_id = {}
+            for L in listings:
+                lid = L.get('listing_id')
+                if lid:
+                    by_id.setdefault(str(lid), L)
+            _LISTINGS_CACHE['by_id'] = by_id
+            _LISTINGS_CACHE['payload'] = None  # serialized lazily by get_listings_payload()
+            # load_saved_listings() may create/migrate the DB, so key on the post-load state
+            _LISTINGS_CACHE['key'] = _listings_cache_key()
+            _write_stats_file(_LISTINGS_CACHE['key'], _LISTINGS_CACHE['stats'])
+        return _LISTINGS_CACHE['data'], _LISTINGS_CACHE['stats']
+
+
+def get_listings_payload():
+    """Return /api/listings as JSON bytes, serialized at most once per cache generation."""
+    listings, _ = get_cached()
+    with _LISTINGS_CACHE_LOCK:
+        if _LISTINGS_CACHE['data'] is listings and _LISTINGS_CACHE['payload'] is not None:
+            return _LISTINGS_CACHE['payload']
+    if orjson is not None:
+        payload = orjson.dumps(listings, option=orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = app.json.dumps(listings).encode('utf-8')
+    with _LISTINGS_CACHE_LOCK:
+        # Only keep it if the cache wasn't rebuilt while we were serializing
+        if _LISTINGS_CACHE['data'] is listings:
+            _LISTINGS_CACHE['payload'] = payload
+    return payload
+
+
+def get_listing_by_id(listing_id):
+    """Return the saved listing with this listing_id (O(1) lookup in the cache), or None."""
+    get_cached()
+    with _LISTINGS_CACHE_LOCK:
+        return _LISTINGS_CACHE['by_id'].get(str(listing_id))
+
+
+def _stats_file_key(key):
+    """Cache key in the JSON-compatible form stored in stats.json."""
+    return [list(k) if k is not None else None for k in key]
+
+
+def _write_stats_file(key, stats):
+    """Persist stats next to listings.json so a fresh process can serve /api/stats without loading listings."""
+    payload = {'key': _stats_file_key(key), 'stats': stats}
+    try:
+        if orjson is not None:
+            STATS_FILE.write_bytes(orjson.dumps(payload))
+        else:
+            STATS_FILE.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+    except OSError as e:
+        print(f"Warning: Could not write stats file: {e}")
+
+
+def get_cached_stats():
+    """Return stats for saved listings from memory, or from stats.json if it matches the current data files."""
+    key = _listings_cache_key()
+    with _LISTINGS_CACHE_LOCK:
+        if _LISTINGS_CACHE['key'] == key:
+            return _LISTINGS_CACHE['stats']
+    try:
+        payload = _read_json_file(STATS_FILE)
+        if isinstance(payload, dict) and payload.get('key') == _stats_file_key(key):
+            return payload.get('stats') or get_listings_stats([])
+    except (OSError, ValueError):
+        pass
+    return get_cached()[1]
+
+
+def invalidate_listings_cache():
+    """Force the next get_cached() call to reload from disk."""
+    with _LISTINGS_CACHE_LOCK:
+        _LISTINGS_CACHE['key'] = None
 
 @app.route('/health')
 def health():
@@ -371,12 +533,26 @@ def favicon():
     """Avoid 404 in console when browser requests favicon."""
     return '', 204
 
-@app.route('/api/chromedriver-check')
-def chromedriver_check():
-    """Check ChromeDriver availability for debugging"""
+def _find_nix_chromedrivers(limit=5):
+    """Return up to `limit` /nix/store/*/bin/chromedriver paths, stopping as soon as enough are found."""
+    matches = []
+    try:
+        with os.scandir('/nix/store') as it:
+            for entry in it:
+                path = os.path.join(entry.path, 'bin', 'chromedriver')
+                if os.path.exists(path):
+                    matches.append(path)
+                    if len(matches) >= limit:
+                        break
+    except OSError:
+        pass
+    return matches
+
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_check_results():
+    """Probe ChromeDriver/Chromium locations once per process (they don't change while running)."""
     import shutil
-    import glob
-    import os
     
     results = {
         'system_chromedriver': None,
@@ -394,8 +570,7 @@ def chromedriver_check():
         results['system_chromedriver_executable'] = os.access(system_chromedriver, os.X_OK) if system_chromedriver else False
     
     # Check nix store
-    nix_matches = glob.glob('/nix/store/*/bin/chromedriver')
-    results['nix_store_chromedrivers'] = nix_matches[:5]  # Limit to first 5
+    results['nix_store_chromedrivers'] = _find_nix_chromedrivers(limit=5)
     
     # Check standard locations
     standard_paths = ['/usr/bin/chromedriver', '/usr/local/bin/chromedriver', '/opt/chromedriver/chromedriver']
@@ -418,7 +593,43 @@ def chromedriver_check():
             results['chromium_path'] = path
             break
     
-    return jsonify(results), 200
+    return results
+
+
+@app.route('/api/chromedriver-check')
+def chromedriver_check():
+    """Check ChromeDriver availability for debugging"""
+    return jsonify(_chromedriver_check_results()), 200
+
+# Saved listings carry seller contacts and change right after a scrape: never let shared caches keep
+# them, and have browsers revalidate every time (a matching ETag still comes back as a cheap 304)
+API_CACHE_CONTROL = 'private, no-cache'
+# The dashboard reloads itself after a scrape, so browsers must revalidate it every time
+PAGE_CACHE_CONTROL = 'no-cache'
+
+
+def _listings_etag(*extra_files):
+    """ETag derived from the (mtime_ns, size) of the listings files plus any extra files the response depends on."""
+    key = _listings_cache_key() + tuple(_file_key(p) for p in extra_files)
+    return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=12).hexdigest()
+
+
+def _not_modified(etag, cache_control):
+    """Return a 304 response when the client already holds this ETag, else None."""
+    if not request.if_none_match.contains(etag):
+        return None
+    response = make_response('', 304)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response
+
+
+def _with_cache_headers(response, etag, cache_control):
+    """Attach ETag and Cache-Control to a response."""
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = cache_control
+    return response
+
 
 def _listings_for_cards(listings):
     """Return listings with description stripped so cards never show description bar."""
@@ -434,14 +645,15 @@ def _listings_for_cards(listings):
 def index():
     """Main dashboard page – shows saved listings (cards only); full description on View page."""
     try:
-        listings = load_saved_listings()
-        stats = get_listings_stats(listings)
+        etag = _listings_etag(CONFIG_FILE, _template_dir / 'dashboard.html')
+        cached = _not_modified(etag, PAGE_CACHE_CONTROL)
+        if cached is not None:
+            return cached
+        listings, stats = get_cached()
         config = load_config()
         card_listings = _listings_for_cards(listings)
         resp = render_template('dashboard.html', listings=card_listings, stats=stats, config=config)
-        response = make_response(resp)
-        response.headers['Cache-Control'] = 'no-store, no-cache, must-revalidate, max-age=0'
-        return response
+        return _with_cache_headers(make_response(resp), etag, PAGE_CACHE_CONTROL)
     except Exception as e:
         import traceback
         error_msg = f"Error loading dashboard: {str(e)}\n\n{traceback.format_exc()}"
@@ -452,8 +664,7 @@ def index():
 def saved_listings_page():
     """Dedicated page for all saved (scraped) leads."""
     try:
-        listings = load_saved_listings()
-        stats = get_listings_stats(listings)
+        listings, stats = get_cached()
         config = load_config()
         card_listings = _listings_for_cards(listings)
         return render_template('saved_listings.html', listings=card_listings, stats=stats, config=config)
@@ -470,15 +681,22 @@ def api_categories():
 @app.route('/api/listings')
 def api_listings():
     """API endpoint to get listings (saved leads)"""
-    listings = load_saved_listings()
-    return jsonify(listings)
+    etag = _listings_etag()
+    cached = _not_modified(etag, API_CACHE_CONTROL)
+    if cached is not None:
+        return cached
+    response = Response(get_listings_payload(), mimetype='application/json')
+    return _with_cache_headers(response, etag, API_CACHE_CONTROL)
 
 @app.route('/api/stats')
 def api_stats():
     """API endpoint to get statistics (from saved)"""
-    listings = load_saved_listings()
-    stats = get_listings_stats(listings)
-    return jsonify(stats)
+    etag = _listings_etag()
+    cached = _not_modified(etag, API_CACHE_CONTROL)
+    if cached is not None:
+        return cached
+    stats = get_cached_stats()
+    return _with_cache_headers(jsonify(stats), etag, API_CACHE_CONTROL)
 
 
 @app.route('/api/save-listings', methods=['POST'])
@@ -499,10 +717,10 @@ def api_save_listings():
 @app.route('/listing/<listing_id>/download-images')
 def download_listing_images(listing_id):
     """Download all images for a listing as a ZIP file"""
+    import io
     import zipfile
     import requests
-    listings = load_saved_listings()
-    listing = next((l for l in listings if str(l.get('listing_id')) == str(listing_id)), None)
+    listing = get_listing_by_id(listing_id)
     if not listing:
         return "Listing not found", 404
     images = listing.get('images') or []
@@ -537,8 +755,7 @@ def download_listing_images(listing_id):
 @app.route('/listing/<listing_id>')
 def view_listing(listing_id):
     """View individual listing details (from saved)"""
-    listings = load_saved_listings()
-    listing = next((l for l in listings if str(l.get('listing_id')) == str(listing_id)), None)
+    listing = get_listing_by_id(listing_id)
     
     if not listing:
         return "Listing not found", 404
@@ -558,34 +775,29 @@ def download_json():
 
 @app.route('/download/csv')
 def download_csv():
-    """Download saved listings as CSV with contact information"""
-    import re
-    listings = load_saved_listings()
+    """Download saved listings as CSV with contact information (streamed row by row)"""
+    import csv
+    import io
+    listings, _ = get_cached()
     if not listings:
         return "No listings found", 404
     
-    # Create CSV in memory
-    output = io.StringIO()
     fieldnames = [
         'listing_id', 'title', 'description', 'price', 'city', 'location',
         'posted_time', 'seller_name', 'seller_url', 'category',
         'url', 'image_count', 'tags', 'phone_number', 'whatsapp_number', 'email'
     ]
     
-    writer = csv.DictWriter(output, fieldnames=fieldnames)
-    writer.writeheader()
-    
-    for listing in listings:
-        contact_info = listing.get('contact_info', {})
-        phone_numbers = contact_info.get('phone_numbers', [])
+    def listing_row(listing):
+        contact_info = listing.get('contact_info') or {}
+        phone_numbers = contact_info.get('phone_numbers') or []
         phone_number = ', '.join(phone_numbers) if phone_numbers else ''
         
         # Extract WhatsApp number from link
         whatsapp_number = ''
-        whatsapp_link = contact_info.get('whatsapp_link', '')
+        whatsapp_link = contact_info.get('whatsapp_link') or ''
         if whatsapp_link:
-            # Extract phone from WhatsApp link
-            whatsapp_match = re.search(r'(?:wa\.me/|whatsapp.*phone=)(\d+)', whatsapp_link)
+            whatsapp_match = WHATSAPP_RE.search(whatsapp_link)
             if whatsapp_match:
                 whatsapp_number = whatsapp_match.group(1)
                 # Remove country code if present
@@ -593,10 +805,10 @@ def download_csv():
                     whatsapp_number = whatsapp_number[3:]
         
         # Extract email
-        emails = contact_info.get('emails', [])
+        emails = contact_info.get('emails') or []
         email = ', '.join(emails) if emails else ''
         
-        row = {
+        return {
             'listing_id': listing.get('listing_id', ''),
             'title': listing.get('title', ''),
             'description': listing.get('description', ''),
@@ -608,35 +820,103 @@ def download_csv():
             'seller_url': listing.get('seller_url', ''),
             'category': listing.get('category', ''),
             'url': listing.get('url', ''),
-            'image_count': len(listing.get('images', [])),
-            'tags': ', '.join(listing.get('tags', [])),
+            'image_count': len(listing.get('images') or []),
+            'tags': ', '.join(listing.get('tags') or []),
             'phone_number': phone_number,
             'whatsapp_number': whatsapp_number,
             'email': email
         }
-        writer.writerow(row)
     
-    # Create response
-    output.seek(0)
-    mem = io.BytesIO()
-    mem.write(output.getvalue().encode('utf-8-sig'))
-    mem.seek(0)
+    def generate():
+        # UTF-8 BOM so Excel opens Arabic text correctly
+        yield b'\xef\xbb\xbf'
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=fieldnames)
+        writer.writeheader()
+        yield buf.getvalue().encode('utf-8')
+        
+        for listing in listings:
+            buf.seek(0)
+            buf.truncate()
+            # The 200 is already sent: skip a malformed listing instead of cutting the file short
+            try:
+                writer.writerow(listing_row(listing))
+            except Exception as e:
+                print(f"CSV export: skipping malformed listing: {e}")
+                continue
+            yield buf.getvalue().encode('utf-8')
     
-    return send_file(
-        mem,
+    return Response(
+        generate(),
         mimetype='text/csv',
-        as_attachment=True,
-        download_name='haraj_listings.csv'
+        headers={'Content-Disposition': 'attachment; filename=haraj_listings.csv'}
     )
 
+def _write_scraping_status(status=None, pid=None):
+    """Publish scraping status (default: this process's scraping_status) to SCRAPING_STATUS_FILE."""
+    payload = dict(status if status is not None else scraping_status, pid=pid or os.getpid())
+    tmp = SCRAPING_STATUS_FILE.with_suffix('.tmp')
+    try:
+        _ensure_init()
+        tmp.write_text(json.dumps(payload, ensure_ascii=False), encoding='utf-8')
+        os.replace(tmp, SCRAPING_STATUS_FILE)
+    except OSError as e:
+        print(f"Warning: Could not write scraping status: {e}")
+
+
+def _pid_alive(pid):
+    """True if a process with this pid exists."""
+    try:
+        os.kill(int(pid), 0)
+    except PermissionError:
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
+    return True
+
+
+def read_scraping_status():
+    """Current scraping status as published by the scraper process."""
+    try:
+        status = _read_json_file(SCRAPING_STATUS_FILE)
+    except (OSError, ValueError):
+        return dict(scraping_status)
+    if not isinstance(status, dict):
+        return dict(scraping_status)
+    pid = status.pop('pid', None)
+    if _scraper_process is not None and _scraper_process.pid == pid:
+        alive = _scraper_process.is_alive()  # also reaps the child once it exits
+    else:
+        alive = _pid_alive(pid)
+    if status.get('is_running') and not alive:
+        status['is_running'] = False
+        status['current_listing'] = 'Finished'
+        status['error'] = status.get('error') or 'Scraper process exited unexpectedly.'
+    return status
+
+
+def _scraping_stop_requested():
+    """True once /api/stop-scraping has dropped the stop marker file."""
+    return SCRAPING_STOP_FILE.exists()
+
+
+class _ScrapingStopped(Exception):
+    """Raised from run_scraper's per-listing callback to end the run when a stop was requested."""
+
+
 def run_scraper(max_listings, category_url):
-    """Run the scraper in background"""
+    """Run the scraper (entry point of the scraper process started by /api/start-scraping)"""
     global scraping_status
+    import logging
+    import time
+    # This process's own stderr (the server log): show the scraper's progress messages
+    logging.basicConfig(level=logging.INFO, format='%(message)s')
     scraping_status['is_running'] = True
     scraping_status['progress'] = 0
     scraping_status['total'] = max_listings
     scraping_status['current_listing'] = 'Starting...'
     scraping_status['error'] = None
+    _write_scraping_status()
     
     try:
         # Import scraper (may fail in Vercel due to Selenium)
@@ -676,6 +956,7 @@ def run_scraper(max_listings, category_url):
             # Find listing URLs: request exact target so we scrape the requested count
             max_pages = max(5, (max_listings + 19) // 20)
             scraping_status['current_listing'] = 'Finding listings...'
+            _write_scraping_status()
             try:
                 listing_urls = scraper.find_listing_urls(
                     category_url, max_pages=max_pages, target_count=max_listings
@@ -692,6 +973,7 @@ def run_scraper(max_listings, category_url):
             
             scraping_status['total'] = len(listing_urls)
             scraping_status['current_listing'] = f'Found {len(listing_urls)} listings. Starting to scrape...'
+            _write_scraping_status()
 
             # Load saved listings for duplicate check
             saved = load_saved_listings()
@@ -700,33 +982,56 @@ def run_scraper(max_listings, category_url):
 
             all_listings = []
             skipped_dupes = 0
-            for idx, url in enumerate(listing_urls, 1):
-                if not scraping_status['is_running']:
-                    break
-                scraping_status['progress'] = idx
-                scraping_status['current_listing'] = f'Scraping listing {idx}/{len(listing_urls)}...'
-
-                listing_data = scraper.scrape_listing(url)
-                # Retry once if no data (page load or selector timing)
-                if (not listing_data or (not listing_data.get('listing_id') and not listing_data.get('url'))):
-                    time.sleep(1.5)
-                    listing_data = scraper.scrape_listing(url)
-                if not listing_data or (not listing_data.get('listing_id') and not listing_data.get('url')):
-                    print(f"  Skipping listing - no data extracted: {url}")
-                    continue
+            scraped = 0
+
+            def has_data(listing_data):
+                return bool(listing_data) and bool(listing_data.get('listing_id') or listing_data.get('url'))
+
+            def add_listing(listing_data):
+                nonlocal skipped_dupes
                 lid = str(listing_data.get('listing_id') or '')
                 url_norm = (listing_data.get('url') or '').strip().rstrip('/')
                 if lid in existing_ids or url_norm in existing_urls:
                     skipped_dupes += 1
-                    continue
+                    return
                 all_listings.append(listing_data)
                 if lid:
                     existing_ids.add(lid)
                 if url_norm:
                     existing_urls.add(url_norm)
 
+            def on_listing(listing_data):
+                # Called as each page is scraped (LISTING_TABS load at once); the stop marker ends the run here
+                nonlocal scraped
+                scraped += 1
+                if has_data(listing_data):
+                    add_listing(listing_data)
+                if _scraping_stop_requested():
+                    raise _ScrapingStopped()
+                scraping_status['progress'] = scraped
+                scraping_status['current_listing'] = f'Scraped {scraped}/{len(listing_urls)} listings...'
+                _write_scraping_status()
+
+            try:
+                results = scraper.scrape_listings(listing_urls, on_listing=on_listing)
+                # Retry once the pages that gave no data (page load or selector timing)
+                for url, listing_data in zip(listing_urls, results):
+                    if has_data(listing_data):
+                        continue
+                    if _scraping_stop_requested():
+                        raise _ScrapingStopped()
+                    time.sleep(1.5)
+                    listing_data = scraper.scrape_listing(url)
+                    if has_data(listing_data):
+                        add_listing(listing_data)
+                    else:
+                        print(f"  Skipping listing - no data extracted: {url}")
+            except _ScrapingStopped:
+                scraping_status['error'] = "Scraping stopped by user (may take a moment to fully halt current task)."
+
             if all_listings or skipped_dupes:
                 scraping_status['current_listing'] = 'Saving to saved listings...'
+                _write_scraping_status()
                 try:
                     merged, added, skipped_merge = merge_saved_listings(all_listings)
                     save_saved_listings(merged)
@@ -756,13 +1061,15 @@ def run_scraper(max_listings, category_url):
     finally:
         scraping_status['is_running'] = False
         scraping_status['current_listing'] = 'Finished'
+        _write_scraping_status()
 
 @app.route('/api/start-scraping', methods=['POST'])
 def start_scraping():
     """Start scraping listings. When prompt is provided, resolve best category from prompt (OpenAI or keyword fallback)."""
-    global scraping_status
+    global _scraper_process
+    import multiprocessing
     
-    if scraping_status['is_running']:
+    if read_scraping_status().get('is_running'):
         return jsonify({'error': 'Scraping is already running'}), 400
     
     try:
@@ -774,9 +1081,24 @@ def start_scraping():
         if max_listings < 1 or max_listings > 500:
             return jsonify({'error': 'Number of listings must be between 1 and 500'}), 400
 
-        thread = threading.Thread(target=run_scraper, args=(max_listings, category_url))
-        thread.daemon = True
-        thread.start()
+        try:
+            SCRAPING_STOP_FILE.unlink()
+        except FileNotFoundError:
+            pass
+        # Separate (spawned) process: Selenium is only ever imported there, never in web workers
+        process = multiprocessing.get_context('spawn').Process(
+            target=run_scraper, args=(max_listings, category_url), daemon=True
+        )
+        process.start()
+        _scraper_process = process
+        # Publish "running" right away so status polls don't see the previous run's file
+        _write_scraping_status({
+            'is_running': True,
+            'progress': 0,
+            'total': max_listings,
+            'current_listing': 'Starting...',
+            'error': None,
+        }, pid=process.pid)
         return jsonify({
             'status': 'started',
             'message': f'Scraping started for {max_listings} listings from Haraj',
@@ -820,16 +1142,20 @@ def estimate_time_api():
 @app.route('/api/scraping-status')
 def scraping_status_api():
     """Get current scraping status"""
-    return jsonify(scraping_status)
+    return jsonify(read_scraping_status())
 
 @app.route('/api/stop-scraping', methods=['POST'])
 def stop_scraping():
     """Stop scraping (if possible)"""
-    global scraping_status
-    # Note: This is a simple implementation. For full control, you'd need process management
-    scraping_status['is_running'] = False
-    scraping_status['error'] = "Scraping stopped by user (may take a moment to fully halt current task)."
-    return jsonify({'message': 'Scraping stop requested', 'status': scraping_status})
+    # The scraper process checks for the stop file between listings, then saves what it has
+    try:
+        SCRAPING_STOP_FILE.touch()
+    except OSError as e:
+        return jsonify({'message': f'Could not request stop: {e}', 'status': read_scraping_status()}), 500
+    status = read_scraping_status()
+    status['is_running'] = False
+    status['error'] = "Scraping stopped by user (may take a moment to fully halt current task)."
+    return jsonify({'message': 'Scraping stop requested', 'status': status})
 
 @app.route('/api/settings', methods=['GET'])
 def get_settings():
@@ -880,13 +1206,23 @@ def _log_registered_api_routes():
         print("  WARNING: Missing API routes! Registered:", api_routes)
 
 
+def warm_up():
+    """Prime the listings/stats cache and compile templates so the first request after a (cold) start doesn't pay for it."""
+    _ensure_init()
+    try:
+        for template_name in ('dashboard.html', 'saved_listings.html', 'listing_detail.html'):
+            app.jinja_env.get_template(template_name)
+        get_cached()
+    except Exception as e:
+        print(f"Warning: Dashboard warm-up failed: {e}")
+
+
 if __name__ == '__main__':
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
     print("=" * 70)
     print("Haraj Scraper Dashboard")
     print("=" * 70)
     _log_registered_api_routes()
+    warm_up()
     print(f"\nDashboard running at: http://localhost:5000")
     print(f"Data directory: {DATA_DIR.absolute()}")
     print("\nMake sure you have scraped some listings first!")
@@ -0,0 +1,7 @@
+"""Gunicorn settings, picked up from the working directory by start.sh / nixpacks."""
+
+
+def when_ready(server):
+    """Prime the dashboard's listings/stats cache in the master; with --preload the forked workers inherit it."""
+    import dashboard
+    dashboard.warm_up()
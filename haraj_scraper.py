@@ -15,6 +15,30 @@ import csv
 from pathlib import Path
 import random
 import sys
+import shutil
+
+try:
+    import lxml  # noqa: F401  (C parser for BeautifulSoup)
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+# Image URLs that are site chrome (icons, logos, badges, avatars), not listing photos
+_IMG_EXCLUDE_RE = re.compile(r'icon|logo|badge|avatar', re.IGNORECASE)
+_LISTING_ID_RE = re.compile(r'/(\d+)/')
+_PRICE_RES = (
+    re.compile(r'\d+.*ريال|ريال.*\d+', re.IGNORECASE),
+    re.compile(r'\d+.*ر\.س|ر\.س.*\d+', re.IGNORECASE),
+)
+_CITY_HREF_RE = re.compile(r'/city/')
+_RELATIVE_TIME_RE = re.compile(r'الآن|منذ|ago|قبل', re.IGNORECASE)
+_USER_HREF_RE = re.compile(r'/users/')
+_TAG_HREF_RE = re.compile(r'/tags/')
+_CONTACT_TEXT_RE = re.compile(r'تواصل|اتصل|مراسلة|contact', re.IGNORECASE)
+# Saudi phone numbers: +966..., 05..., 5...
+_PHONE_RE = re.compile(r'(\+966|05|5)[\d\s-]{8,}')
+# Listing links: /11173528712/title/
+_LISTING_HREF_RE = re.compile(r'/\d+/[^/]+/$')
 
 
 class HarajScraper:
@@ -101,7 +125,7 @@ class HarajScraper:
             response = self.session.get(url, timeout=30)
             response.encoding = 'utf-8'
             response.raise_for_status()
-            return BeautifulSoup(response.text, 'html.parser')
+            return BeautifulSoup(response.text, _HTML_PARSER)
         except Exception as e:
             print(f"Error fetching {url}: {e}")
             return None
@@ -109,7 +133,7 @@ class HarajScraper:
     def extract_listing_id(self, url: str) -> Optional[str]:
         """Extract listing ID from URL"""
         # URL format: https://haraj.com.sa/11173528712/هيلكس_غمارتين/
-        match = re.search(r'/(\d+)/', url)
+        match = _LISTING_ID_RE.search(url)
         return match.group(1) if match else None
     
     def extract_listing_details(self, soup: BeautifulSoup, url: str) -> Dict:
@@ -146,10 +170,7 @@ class HarajScraper:
             listing_data['description'] = article.get_text(strip=True)
         
         # Extract price (look for price indicators)
-        price_patterns = [
-            soup.find(string=re.compile(r'\d+.*ريال|ريال.*\d+', re.IGNORECASE)),
-            soup.find(string=re.compile(r'\d+.*ر\.س|ر\.س.*\d+', re.IGNORECASE)),
-        ]
+        price_patterns = [soup.find(string=price_re) for price_re in _PRICE_RES]
         for pattern in price_patterns:
             if pattern:
                 price_text = pattern.strip()
@@ -157,24 +178,24 @@ class HarajScraper:
                 break
         
         # Extract location/city
-        city_links = soup.find_all('a', href=re.compile(r'/city/'))
+        city_links = soup.find_all('a', href=_CITY_HREF_RE)
         if city_links:
             listing_data['city'] = city_links[0].get_text(strip=True)
             listing_data['location'] = listing_data['city']
         
         # Extract posted time
-        time_indicators = soup.find_all(string=re.compile(r'الآن|منذ|ago|قبل', re.IGNORECASE))
+        time_indicators = soup.find_all(string=_RELATIVE_TIME_RE)
         if time_indicators:
             listing_data['posted_time'] = time_indicators[0].strip()
         
         # Extract seller information
-        seller_link = soup.find('a', href=re.compile(r'/users/'))
+        seller_link = soup.find('a', href=_USER_HREF_RE)
         if seller_link:
             listing_data['seller_name'] = seller_link.get_text(strip=True)
             listing_data['seller_url'] = urljoin(self.base_url, seller_link.get('href', ''))
         
         # Extract category and tags
-        breadcrumb_links = soup.find_all('a', href=re.compile(r'/tags/'))
+        breadcrumb_links = soup.find_all('a', href=_TAG_HREF_RE)
         tags = []
         for link in breadcrumb_links:
             tag_text = link.get_text(strip=True)
@@ -191,7 +212,7 @@ class HarajScraper:
             src = img.get('src') or img.get('data-src') or img.get('data-lazy-src')
             if src:
                 # Filter out icons, logos, and small images
-                if any(exclude in src.lower() for exclude in ['icon', 'logo', 'badge', 'avatar']):
+                if _IMG_EXCLUDE_RE.search(src):
                     continue
                 # Make absolute URL
                 img_url = urljoin(self.base_url, src)
@@ -202,13 +223,12 @@ class HarajScraper:
         
         # Try to extract contact information
         # Look for contact buttons or phone number patterns
-        contact_button = soup.find(string=re.compile(r'تواصل|اتصل|مراسلة|contact', re.IGNORECASE))
+        contact_button = soup.find(string=_CONTACT_TEXT_RE)
         if contact_button:
             listing_data['contact_info']['has_contact_button'] = True
         
         # Look for phone numbers in text (Saudi format)
-        phone_pattern = re.compile(r'(\+966|05|5)[\d\s-]{8,}')
-        phone_matches = phone_pattern.findall(soup.get_text())
+        phone_matches = _PHONE_RE.findall(soup.get_text())
         if phone_matches:
             listing_data['contact_info']['phone_numbers'] = list(set(phone_matches))
         
@@ -235,9 +255,10 @@ class HarajScraper:
             filepath = self.images_dir / filename
             
             # Save image
+            # Copy in C with a 1 MB buffer; decode_content undoes any gzip/deflate Content-Encoding
+            response.raw.decode_content = True
             with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
             return str(filepath)
         except Exception as e:
@@ -285,6 +306,7 @@ class HarajScraper:
     def find_listing_urls(self, category_url: str, max_pages: int = 10) -> List[str]:
         """Find all listing URLs from a category page"""
         listing_urls = []
+        seen_urls = set()
         
         for page in range(1, max_pages + 1):
             # Try different pagination patterns
@@ -310,14 +332,15 @@ class HarajScraper:
             
             # Find all listing links
             # Pattern: /11173528712/title/
-            links = soup.find_all('a', href=re.compile(r'/\d+/[^/]+/$'))
+            links = soup.find_all('a', href=_LISTING_HREF_RE)
             
             page_urls = []
             for link in links:
                 href = link.get('href', '')
                 if href:
                     full_url = urljoin(self.base_url, href)
-                    if full_url not in listing_urls:
+                    if full_url not in seen_urls:
+                        seen_urls.add(full_url)
                         page_urls.append(full_url)
             
             if not page_urls:
@@ -360,8 +383,11 @@ class HarajScraper:
     def save_to_json(self, data: List[Dict], filename: str = "listings.json"):
         """Save scraped data to JSON file"""
         filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
+        tmp = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
+        # Readers (the dashboard mmaps listings.json) never see a half-written or truncated file
+        os.replace(tmp, filepath)
         print(f"\nData saved to {filepath}")
     
     def save_to_csv(self, data: List[Dict], filename: str = "listings.csv"):
@@ -5,11 +5,11 @@ For JavaScript-heavy pages that require browser rendering
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
+from selenium.common.exceptions import NoSuchElementException
 from webdriver_manager.chrome import ChromeDriverManager
 from bs4 import BeautifulSoup
 import json
@@ -17,13 +17,75 @@ import os
 import re
 from urllib.parse import urljoin, urlparse
 import time
-from typing import Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 import csv
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 import random
 import shutil
 import glob
+import copy
+import functools
+import atexit
+import queue
+import shelve
+import threading
+import logging
+import logging.handlers
+import sys
+
+try:
+    import lxml  # noqa: F401  (C parser for BeautifulSoup)
+    _HTML_PARSER = 'lxml'
+except ImportError:
+    _HTML_PARSER = 'html.parser'
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Handlers and level are left to the application (see main())
+logger = logging.getLogger(__name__)
+
+# Regexes used per listing, compiled once
+_LISTING_ID_RE = re.compile(r'/(\d+)/')
+_LISTING_URL_RE = re.compile(r'https?://(?:www\.)?haraj\.com\.sa/(\d{8,})/', re.IGNORECASE)  # 8+ digit Haraj IDs
+_DIGITS_RE = re.compile(r'\d+')
+_ALL_DIGITS_RE = re.compile(r'^\d+$')
+_PRICE_TEXT_RE = re.compile(r'[\d,]+\s*(?:ريال|ر\.س)')
+_CITY_HREF_RE = re.compile(r'/city/')
+_RELATIVE_TIME_RE = re.compile(r'الآن|منذ|قبل|ago', re.IGNORECASE)
+_TEL_RE = re.compile(r'tel:[\+]?(\d+)')
+_NAME_PATTERNS = [
+    re.compile(r'([أ-ي\s]{3,})'),  # Arabic name (3+ Arabic chars)
+    re.compile(r'([A-Za-z\s]{3,})'),  # English name
+]
+# Saudi phone numbers in free text: +966 / 966 / 05 / 5 prefix followed by digits, spaces, dashes
+_PHONE_RE = re.compile(r'(?:\+?966|05|(?<!\d)5)[\d\s-]{9,}')
+_WHITESPACE_DASH_RE = re.compile(r'[\s-]')
+_WHITESPACE_RE = re.compile(r'\s+')
+_WHATSAPP_PHONE_RE = re.compile(r'(?:wa\.me/|whatsapp.*phone=)(\d+)')
+# Cookie names that carry the login session (kept when cookies are rotated)
+_AUTH_COOKIE_RE = re.compile(r'session|auth|token|user', re.IGNORECASE)
+# Image URLs that are site chrome (icons, logos, badges, avatars), not listing photos
+_IMG_EXCLUDE_RE = re.compile(r'icon|logo|badge|avatar', re.IGNORECASE)
+# Blocks that look like script/code (e.g. document.write, function(, <script, etc.)
+_SCRIPT_INDICATOR_RES = [
+    re.compile(pat, re.IGNORECASE | re.DOTALL) for pat in (
+        r'<script[\s\S]*?</script>',
+        r'document\.write\s*\(',
+        r'window\.onload\s*=',
+        r'parent\.postMessage\s*\(',
+        r'function\s*\([^)]*\)\s*\{',
+        r'<iframe[\s\S]*?</iframe>',
+        r'javascript:',
+        r'\.style\.\w+\s*=',
+    )
+]
 
 
 def _path_which(name):
@@ -44,61 +106,51 @@ def _sanitize_text(text: str, max_length: int = 50000) -> str:
     if not text or not isinstance(text, str):
         return (text or '').strip()
     text = text.strip()
-    # Remove blocks that look like script/code (e.g. document.write, function(, <script, etc.)
-    script_indicators = [
-        r'<script[\s\S]*?</script>',
-        r'document\.write\s*\(',
-        r'window\.onload\s*=',
-        r'parent\.postMessage\s*\(',
-        r'function\s*\([^)]*\)\s*\{',
-        r'<iframe[\s\S]*?</iframe>',
-        r'javascript:',
-        r'\.style\.\w+\s*=',
-    ]
-    for pat in script_indicators:
-        text = re.sub(pat, ' ', text, flags=re.IGNORECASE | re.DOTALL)
+    # Remove blocks that look like script/code
+    for pat in _SCRIPT_INDICATOR_RES:
+        text = pat.sub(' ', text)
     # Collapse multiple newlines/spaces
-    text = re.sub(r'\s+', ' ', text)
+    text = _WHITESPACE_RE.sub(' ', text)
     text = text.strip()
     return text[:max_length] if len(text) > max_length else text
 
 
-def estimate_scrape_time(max_listings: int, use_compliance_delays: bool, download_images: bool = False) -> dict:
+def estimate_scrape_time(max_listings: int, use_compliance_delays: bool, download_images: bool = False,
+                         workers: int = 1) -> dict:
     """
     Estimate min/max scrape time in seconds and human-readable string.
-    use_compliance_delays: True when using login (ToS delays), False for anonymous (minimal delays).
+    use_compliance_delays: True when using login (ToS delays, one listing at a time), False for anonymous
+    (LISTING_TABS tabs in each of `workers` browsers, paced only by the THROTTLE_RATE/THROTTLE_BURST budget).
     """
     n = max(1, int(max_listings))
     list_per_page = 25
     pages = max(1, (n + list_per_page - 1) // list_per_page)
-    # Per-listing delay: with compliance 2-5s, without 0.15-0.4s (fast, no account risk)
+    # Approximate page load time per listing (browser fetch + parse)
+    load_per_listing = (2, 6)
     if use_compliance_delays:
-        delay_per_listing_min = 2
-        delay_per_listing_max = 5
-        extended_per_10 = (30, 60)
-        pagination_delay = (2, 4)
+        # One listing at a time: load + ToS 2-5s delay, 30-60s extended pause every 10, 2-4s between pages
+        min_sec = n * (load_per_listing[0] + 2) + (n // 10) * 30 + (pages - 1) * 2
+        max_sec = n * (load_per_listing[1] + 5) + (n // 10) * 60 + (pages - 1) * 4
     else:
-        delay_per_listing_min = 0.15
-        delay_per_listing_max = 0.4
-        extended_per_10 = (0, 0)
-        pagination_delay = (0.2, 0.5)
-    # Listing delays
-    min_sec = n * delay_per_listing_min + (n // 10) * extended_per_10[0]
-    max_sec = n * delay_per_listing_max + (n // 10) * extended_per_10[1]
-    # Pagination (between pages)
-    min_sec += (pages - 1) * pagination_delay[0] if pages > 1 else 0
-    max_sec += (pages - 1) * pagination_delay[1] if pages > 1 else 0
-    # Approximate page load time per listing (browser fetch + parse)
-    load_per_listing_min = 2
-    load_per_listing_max = 6
-    min_sec += n * load_per_listing_min
-    max_sec += n * load_per_listing_max
+        # Loads overlap across tabs/browsers, but the shared token bucket caps them at THROTTLE_RATE/s
+        # once the first THROTTLE_BURST are spent
+        parallel = LISTING_TABS * max(1, int(workers))
+        throttled = max(0, n - THROTTLE_BURST) / THROTTLE_RATE
+        min_sec = max(n * load_per_listing[0] / parallel, throttled)
+        max_sec = max(n * load_per_listing[1] / parallel, throttled)
+        # Category pages: one throttled load each plus the scroll/"View more" waits
+        min_sec += pages * 0.3
+        max_sec += pages * 1.2
     if download_images:
         imgs_per_listing = 5
-        img_delay_min = 0.05 if not use_compliance_delays else 0.5
-        img_delay_max = 0.15 if not use_compliance_delays else 1.5
-        min_sec += n * imgs_per_listing * img_delay_min
-        max_sec += n * imgs_per_listing * img_delay_max
+        if use_compliance_delays:
+            # One at a time with a 0.5-1.5s pause after each
+            min_sec += n * imgs_per_listing * 0.5
+            max_sec += n * imgs_per_listing * 1.5
+        else:
+            # A listing's images download at once (IMAGE_DOWNLOAD_WORKERS threads): about one round trip
+            min_sec += n * 0.1
+            max_sec += n * 0.3
     return {
         'min_seconds': int(min_sec),
         'max_seconds': int(max_sec),
@@ -124,9 +176,519 @@ def _valid_posted_time(s: str, max_len: int = 80) -> bool:
     return True
 
 
+# Listing pages loaded at once (one browser tab each) by scrape_listings() when not logged in
+LISTING_TABS = 4
+
+# Concurrent image downloads per listing when not logged in (also the session's pool size)
+IMAGE_DOWNLOAD_WORKERS = 16
+
+# Listings scraped per round when scrape_category() streams to files: only this many results are held at once
+STREAM_CHUNK = 50
+
+# Page loads per second to one host when not logged in, shared by every scraper/worker in the process;
+# up to THROTTLE_BURST loads go out back to back after an idle period
+THROTTLE_RATE = 5.0
+THROTTLE_BURST = 10.0
+
+# File extensions download_image() saves images with
+_IMAGE_EXTENSIONS = ('jpg', 'png', 'webp', 'gif')
+
+# User agents for rotation (ToS compliance)
+_USER_AGENTS = [
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
+]
+
+
+# Page subresources the scraper never reads: listing images are downloaded separately
+# through requests, and <img src> URLs stay in the DOM when the bytes are blocked.
+# CSS is left alone because scrolling/"view more" and the contact modal depend on layout.
+_BLOCKED_URL_PATTERNS = [
+    '*.jpg', '*.jpeg', '*.png', '*.webp', '*.gif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf',
+    '*.mp4', '*.webm',
+]
+
+
+def _block_heavy_resources(driver):
+    """Tell Chrome (via CDP) not to fetch images, fonts and video for this session."""
+    try:
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URL_PATTERNS})
+    except Exception as e:
+        logger.warning("Could not enable resource blocking: %s", e)
+
+
+@functools.lru_cache(maxsize=1)
+def _chromedriver_candidates() -> tuple:
+    """System ChromeDriver locations in lookup order, de-duplicated (PATH and nix store scanned once per process)."""
+    paths = [
+        '/usr/bin/chromedriver',
+        '/usr/local/bin/chromedriver',
+        _path_which('chromedriver'),
+        '/opt/chromedriver/chromedriver',
+    ]
+    paths.extend(glob.glob('/nix/store/*/bin/chromedriver'))  # nixpacks
+    return tuple(dict.fromkeys(p for p in paths if p))
+
+
+@functools.lru_cache(maxsize=1)
+def _find_chromedriver() -> Optional[str]:
+    """First usable system ChromeDriver, or None (resolved once per process)."""
+    import subprocess
+    for path in _chromedriver_candidates():
+        if not os.path.exists(path):
+            continue
+        try:
+            os.chmod(path, 0o755)
+        except OSError as e:
+            if not os.access(path, os.X_OK):
+                logger.error("Error with ChromeDriver at %s: %s", path, e)
+                continue
+        # Cheap sanity check (milliseconds) instead of launching a browser
+        try:
+            subprocess.run([path, '--version'], capture_output=True, timeout=2, check=True)
+        except (subprocess.CalledProcessError, subprocess.TimeoutExpired, OSError) as e:
+            logger.warning("ChromeDriver at %s failed --version check: %s", path, e)
+            continue
+        logger.info("Using system ChromeDriver at: %s", path)
+        return path
+    return None
+
+
+def _launch_chrome(headless: bool = True, user_agent: str = None):
+    """Start a Chrome WebDriver (system ChromeDriver first, webdriver-manager as fallback)."""
+    # Setup Chrome options
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument('--headless')
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--disable-software-rasterizer')
+    chrome_options.add_argument('--disable-extensions')
+    chrome_options.add_argument('--disable-setuid-sandbox')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    chrome_options.add_argument('--lang=ar,en')
+    # Images are downloaded separately via requests; the browser never needs to fetch or decode them
+    # (catches image URLs without an extension that _BLOCKED_URL_PATTERNS misses)
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.default_content_setting_values.notifications': 2,
+    })
+    chrome_options.add_argument('--disable-features=Translate,MediaRouter')
+    # driver.get returns at DOMContentLoaded; readiness of the parts we read is awaited explicitly
+    chrome_options.page_load_strategy = 'eager'
+    
+    # For Railway/Linux environments, try to use system Chrome if available
+    # Check for Chrome/Chromium in standard locations (Dockerfile installs to /usr/bin)
+    chrome_binary_paths = [
+        '/usr/bin/google-chrome-stable',  # Dockerfile installs here
+        '/usr/bin/google-chrome',
+        '/usr/bin/chromium',
+        '/usr/bin/chromium-browser',
+    ]
+    
+    # Also check PATH
+    chrome_in_path = _path_which('google-chrome-stable') or _path_which('google-chrome') or _path_which('chromium')
+    if chrome_in_path:
+        chrome_binary_paths.insert(0, chrome_in_path)
+    
+    # Check nix store (if using nixpacks)
+    if os.path.exists('/nix/store'):
+        import subprocess
+        try:
+            chromium_path = subprocess.check_output(['which', 'chromium'], stderr=subprocess.DEVNULL).decode().strip()
+            if chromium_path:
+                chrome_binary_paths.insert(0, chromium_path)
+        except:
+            pass
+    
+    # Set Chrome binary location
+    for chrome_path in chrome_binary_paths:
+        if chrome_path and os.path.exists(chrome_path):
+            chrome_options.binary_location = chrome_path
+            logger.info("Using Chrome binary at: %s", chrome_path)
+            break
+    
+    # Set random user agent (rotation list: _USER_AGENTS)
+    chrome_options.add_argument(f'user-agent={user_agent or random.choice(_USER_AGENTS)}')
+    
+    # Initialize driver with better error handling for Railway
+    # Try system chromedriver first (from nixpacks), then fallback to webdriver-manager
+    driver_path = _find_chromedriver()
+    driver_found = driver_path is not None
+    
+    # If system chromedriver not found, use webdriver-manager
+    if not driver_found:
+        checked = "\n".join(
+            f"  {'[OK]' if os.path.exists(p) else '[--]'} {p}"
+            for p in _chromedriver_candidates()[:10]  # Show first 10
+        )
+        logger.warning(
+            "System ChromeDriver not found! Falling back to webdriver-manager, which may have "
+            "dependency issues (status code 127 means missing shared libraries). "
+            "Make sure Chrome and ChromeDriver are installed.\nChecked paths:\n%s", checked
+        )
+        
+        try:
+            
+            driver_path = ChromeDriverManager().install()
+            # Make sure driver is executable (important for Linux)
+            if os.path.exists(driver_path):
+                # Set executable permissions
+                os.chmod(driver_path, 0o755)
+                # Also make sure parent directories are accessible
+                driver_dir = os.path.dirname(driver_path)
+                depth = 0
+                while driver_dir and driver_dir != '/' and depth < 5:
+                    if os.path.exists(driver_dir):
+                        try:
+                            os.chmod(driver_dir, 0o755)
+                        except:
+                            pass
+                    driver_dir = os.path.dirname(driver_dir)
+                    depth += 1
+                
+                # Verify the file is actually executable
+                if not os.access(driver_path, os.X_OK):
+                    raise Exception(f"ChromeDriver at {driver_path} is not executable even after chmod")
+                
+                # Try to verify it can run (check if it's a valid binary)
+                # This will fail with status 127 if shared libraries are missing, but we'll catch it
+                try:
+                    import subprocess
+                    result = subprocess.run([driver_path, '--version'], 
+                                          capture_output=True, 
+                                          timeout=5,
+                                          stderr=subprocess.PIPE)
+                    if result.returncode != 0:
+                        # Check if it's a missing library error
+                        error_output = result.stderr.decode('utf-8', errors='ignore') if result.stderr else ''
+                        if 'not found' in error_output.lower() or result.returncode == 127:
+                            raise Exception(f"ChromeDriver missing shared libraries. Error: {error_output}")
+                        logger.warning("ChromeDriver version check failed, but continuing...")
+                except subprocess.TimeoutExpired:
+                    logger.warning("ChromeDriver version check timed out")
+                except Exception as version_check_error:
+                    error_str = str(version_check_error)
+                    if '127' in error_str or 'not found' in error_str.lower() or 'missing' in error_str.lower():
+                        # This is a dependency issue - raise it so we can provide better error
+                        raise Exception(f"ChromeDriver cannot execute due to missing dependencies: {error_str}")
+                    logger.warning("Could not verify ChromeDriver version: %s", version_check_error)
+                
+                driver_found = True
+                logger.info("Using webdriver-manager ChromeDriver at: %s", driver_path)
+            else:
+                raise Exception(f"ChromeDriver path from webdriver-manager does not exist: {driver_path}")
+        except Exception as wdm_error:
+            error_msg = f"Failed to initialize ChromeDriver.\n"
+            error_msg += f"System driver not found, and webdriver-manager failed: {str(wdm_error)}\n"
+            error_msg += f"\nTroubleshooting:\n"
+            error_msg += f"1. Make sure 'chromedriver' is in nixpacks.toml nixPkgs list\n"
+            error_msg += f"2. Make sure 'chromium' is in nixpacks.toml nixPkgs list\n"
+            error_msg += f"3. Check Railway logs for chromedriver installation\n"
+            error_msg += f"4. Status code 127 usually means missing shared libraries (libnss3, etc.)"
+            raise Exception(error_msg)
+    
+    # Initialize the actual driver
+    if driver_path and driver_found:
+        try:
+            service = Service(driver_path)
+            driver = webdriver.Chrome(service=service, options=chrome_options)
+            logger.info("ChromeDriver initialized successfully at: %s", driver_path)
+        except Exception as init_error:
+            error_msg = f"Failed to start ChromeDriver at {driver_path}: {str(init_error)}"
+            error_msg += "\nMake sure:"
+            error_msg += "\n1. Chrome/Chromium is installed (check nixpacks.toml)"
+            error_msg += "\n2. ChromeDriver is installed (check nixpacks.toml)"
+            error_msg += "\n3. All required libraries are installed (libnss3, libatk-bridge2.0-0, etc.)"
+            raise Exception(error_msg)
+    else:
+        raise Exception("ChromeDriver path not found or not initialized")
+    _block_heavy_resources(driver)
+    # No implicit wait: missing optional elements return [] at once; required ones use WebDriverWait
+    driver.implicitly_wait(0)
+    return driver
+
+
+class BrowserPool:
+    """
+    Chrome drivers kept alive between scraper instances in this process.
+    
+    Drivers are launched lazily up to `size`, reset (cookies cleared, about:blank) when
+    checked back in, and quit/relaunched once they have served `max_uses` listings.
+    """
+    
+    def __init__(self, size: int = 4, max_uses: int = 200, headless: bool = True):
+        self.size = max(1, int(size))
+        self.max_uses = max(1, int(max_uses))
+        self.headless = headless
+        self._idle = queue.Queue()
+        self._uses = {}  # id(driver) -> listings served
+        self._launched = 0
+        self._lock = threading.Lock()
+    
+    def acquire(self, timeout: float = None):
+        """Check out an idle driver, launching one if the pool is not full yet."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            can_launch = self._launched < self.size
+            if can_launch:
+                self._launched += 1
+        if not can_launch:
+            return self._idle.get(timeout=timeout)
+        try:
+            driver = _launch_chrome(headless=self.headless)
+        except Exception:
+            with self._lock:
+                self._launched -= 1
+            raise
+        with self._lock:
+            self._uses[id(driver)] = 0
+        return driver
+    
+    def release(self, driver, served: int = 0):
+        """Check a driver back in; recycle it once it has served max_uses listings."""
+        with self._lock:
+            uses = self._uses.get(id(driver), 0) + max(0, served)
+            self._uses[id(driver)] = uses
+        if uses < self.max_uses:
+            try:
+                driver.delete_all_cookies()
+                driver.get("about:blank")
+                self._idle.put(driver)
+                return
+            except Exception:
+                pass
+        self._discard(driver)
+    
+    def _discard(self, driver):
+        with self._lock:
+            self._uses.pop(id(driver), None)
+            self._launched -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Quit every idle driver."""
+        while True:
+            try:
+                driver = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
+
+
+_browser_pool = None
+_browser_pool_lock = threading.Lock()
+
+# Open img_etags.db shelves: path -> [shelf, number of scrapers using it]
+_image_meta_dbs = {}
+_image_meta_lock = threading.Lock()
+
+# Token buckets for _throttle(): host -> [tokens, time.monotonic() of last refill]
+_host_buckets = {}
+_host_buckets_lock = threading.Lock()
+
+
+def _throttle(url: str):
+    """Wait only as long as needed to keep page loads to url's host within THROTTLE_RATE."""
+    host = urlparse(url).netloc
+    with _host_buckets_lock:
+        now = time.monotonic()
+        bucket = _host_buckets.setdefault(host, [THROTTLE_BURST, now])
+        bucket[0] = min(THROTTLE_BURST, bucket[0] + (now - bucket[1]) * THROTTLE_RATE)
+        bucket[1] = now
+        # Take the token now (possibly going negative) so concurrent callers queue up behind each other
+        bucket[0] -= 1
+        wait = -bucket[0] / THROTTLE_RATE if bucket[0] < 0 else 0
+    if wait:
+        time.sleep(wait)
+
+
+def get_browser_pool(size: int = 4, max_uses: int = 200, headless: bool = True) -> BrowserPool:
+    """Process-wide BrowserPool (created on first call; later arguments are ignored)."""
+    global _browser_pool
+    with _browser_pool_lock:
+        if _browser_pool is None:
+            _browser_pool = BrowserPool(size=size, max_uses=max_uses, headless=headless)
+            atexit.register(_browser_pool.close)
+        return _browser_pool
+
+
+# Price selectors, most specific first (evaluated in the browser by _LISTING_HARVEST_JS)
+_PRICE_XPATHS = [
+    "//*[contains(@data-testid, 'price') or @data-testid='post_price']",
+    "//*[@aria-label and (contains(@aria-label, 'ريال') or contains(@aria-label, 'السعر'))]",
+    "//*[contains(@class, 'price') and (contains(., 'ريال') or contains(., 'ر.س'))]",
+    "//*[contains(text(), 'ريال') or contains(text(), 'ر.س')]",
+]
+
+# Tag links inside the listing content (not nav/breadcrumb), in priority order
+_TAG_CONTENT_XPATHS = [
+    "//article//a[contains(@href, '/tags/')]",
+    "//main//a[contains(@href, '/tags/')]",
+    "//*[contains(@data-testid, 'post') or contains(@class, 'post') or contains(@class, 'listing')]//a[contains(@href, '/tags/')]",
+    "//*[@data-testid='post-article']/..//a[contains(@href, '/tags/')]",  # parent of article
+]
+
+# Returns the raw texts/attributes extract_listing_details() needs in one WebDriver round trip.
+# arguments[0] = _PRICE_XPATHS, arguments[1] = _TAG_CONTENT_XPATHS
+_LISTING_HARVEST_JS = r"""
+const xp = (expr) => {
+    const res = document.evaluate(expr, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < res.snapshotLength; i++) nodes.push(res.snapshotItem(i));
+    return nodes;
+};
+const css = (sel) => document.querySelector(sel);
+const text = (el) => ((el && (el.innerText || el.textContent)) || '').trim();
+const cssText = (sel) => text(css(sel));
+const absUrl = (u) => { try { return u ? new URL(u, document.baseURI).href : ''; } catch (e) { return ''; } };
+const timeEl = css('time[datetime]');
+const seller = css('a[href*="/users/"]');
+return {
+    title: cssText('h1') || cssText('[data-testid="post_title"]'),
+    description: cssText('article[data-testid="post-article"]') || cssText('article'),
+    price_candidates: arguments[0].map((expr) => xp(expr).map(text)),
+    city: cssText('a[href*="/city/"]'),
+    time_datetime: timeEl ? (timeEl.getAttribute('datetime') || '') : '',
+    time_text: text(timeEl),
+    time_testid_text: cssText('[data-testid*="time"], [data-testid*="date"]'),
+    time_relative_texts: xp("//*[contains(text(), 'الآن') or contains(text(), 'منذ') or contains(text(), 'قبل')]").map(text),
+    seller_name: text(seller),
+    seller_href: seller ? (seller.href || '') : '',
+    tag_groups: arguments[1].map((expr) => xp(expr).map(text)),
+    all_tags: Array.from(document.querySelectorAll('a[href*="/tags/"]'), text),
+    images: Array.from(document.images, (img) => absUrl(img.currentSrc || img.src || img.dataset.src || img.dataset.lazySrc)).filter(Boolean),
+};
+"""
+
+
+# Elements in the contact modal that hold just the seller name
+_SELLER_NAME_SELECTORS = ['[data-testid*="name"]', '[class*="seller-name"]', '[class*="user-name"]']
+
+# Contact modal/dialog container, in priority order
+_CONTACT_MODAL_SELECTORS = [
+    'div[class*="modal"], div[class*="dialog"], div[role*="dialog"]',
+    'div[data-testid*="contact"], div[data-testid*="modal"]',
+    '[class*="contact-info"], [class*="contact-details"]',
+]
+
+# Everything read from the open contact modal, in one round trip.
+# arguments[0] = _CONTACT_MODAL_SELECTORS, arguments[1] = seller-name selectors (tried in order);
+# name is [selector, text] of the first non-empty name element in the modal, or null
+_CONTACT_MODAL_JS = r"""
+const text = (el) => ((el && (el.innerText || el.textContent)) || '').trim();
+const linkHref = (sel) => { const a = document.querySelector(sel); return a ? (a.href || '') : ''; };
+let modal = null;
+for (const sel of arguments[0]) {
+    modal = document.querySelector(sel);
+    if (modal) break;
+}
+let name = null;
+if (modal) {
+    for (const sel of arguments[1]) {
+        const t = text(modal.querySelector(sel));
+        if (t) { name = [sel, t]; break; }
+    }
+}
+return {
+    modal_found: !!modal,
+    modal_text: modal ? (modal.innerText || '') : '',
+    name: name,
+    tel_href: linkHref('a[href^="tel:"]'),
+    whatsapp_href: linkHref('a[href*="wa.me"], a[href*="whatsapp"]'),
+};
+"""
+
+# Category-page links that are never listings, even when they match _LISTING_URL_RE
+_LISTING_LINK_SKIP_PATHS = ('/city/', '/users/', '/tags/', '/search/', '/post', '/sitemap', '/en/')
+
+# arguments[0] = _LISTING_URL_RE.pattern (also valid JS), arguments[1] = _LISTING_LINK_SKIP_PATHS;
+# returns the distinct resolved hrefs that look like listings
+_LISTING_LINKS_JS = r"""
+const re = new RegExp(arguments[0], 'i');
+const skip = arguments[1];
+const hrefs = new Set();
+for (const a of document.querySelectorAll('a[href]')) {
+    const h = a.href;
+    if (typeof h === 'string' && re.test(h) && !skip.some((p) => h.includes(p))) hrefs.add(h);
+}
+return Array.from(hrefs);
+"""
+
+# "View more" controls on category pages, in priority order
+_VIEW_MORE_XPATHS = [
+    "//a[contains(text(), 'مشاهدة المزيد')]",
+    "//button[contains(text(), 'مشاهدة المزيد')]",
+    "//*[contains(text(), 'مشاهدة المزيد') and (self::a or self::button or @role='button')]",
+]
+
+# arguments[0] = _VIEW_MORE_XPATHS; returns the first visible, enabled match (scrolled into view) or null
+_VIEW_MORE_JS = r"""
+for (const expr of arguments[0]) {
+    const res = document.evaluate(expr, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    for (let i = 0; i < res.snapshotLength; i++) {
+        const el = res.snapshotItem(i);
+        if (el.disabled || !el.getClientRects().length || getComputedStyle(el).visibility === 'hidden') continue;
+        el.scrollIntoView({block: 'center'});
+        return el;
+    }
+}
+return null;
+"""
+
+# Drops the contact/login modal (and its scroll lock) in one synchronous call, instead of ESC + sleep
+_CLOSE_MODAL_JS = r"""
+document.querySelectorAll('div[class*="modal"], div[class*="dialog"], div[role*="dialog"]').forEach((el) => el.remove());
+document.body.style.overflow = '';
+document.documentElement.style.overflow = '';
+"""
+
+
+def _json_bytes(obj, indent: bool = False) -> bytes:
+    """UTF-8 JSON for obj (Arabic left unescaped); serialized by orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0))
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None).encode('utf-8')
+
+
+@functools.lru_cache(maxsize=8192)
+def _listing_id_from_url(url: str) -> Optional[str]:
+    """Numeric listing ID from a Haraj URL (same URL is looked up again on retries and for dedupe)."""
+    match = _LISTING_ID_RE.search(url)
+    return match.group(1) if match else None
+
+
+def _normalize_phone(raw: str) -> Optional[str]:
+    """Strip spaces/dashes and the 966 country code; None unless 9+ digits remain."""
+    phone = _WHITESPACE_DASH_RE.sub('', raw)
+    if phone.startswith('966') and len(phone) > 9:
+        phone = phone[3:]
+    elif phone.startswith('+966'):
+        phone = phone[4:]
+    return phone if len(phone) >= 9 else None
+
+
+def _plausible_name(name: str) -> bool:
+    """Not too long, not phone-like."""
+    return 3 <= len(name) <= 50 and not _ALL_DIGITS_RE.match(name)
+
+
 class HarajScraperSelenium:
     def __init__(self, output_dir: str = "scraped_data", download_images: bool = True, headless: bool = True, 
-                 username: str = None, password: str = None):
+                 username: str = None, password: str = None, pool: 'BrowserPool' = None, driver=None):
         """
         Initialize the Haraj scraper with Selenium
         
@@ -134,227 +696,72 @@ class HarajScraperSelenium:
             output_dir: Directory to save scraped data and images
             download_images: Whether to download images
             headless: Run browser in headless mode
+            pool: Check the browser out of this BrowserPool instead of launching one
+            driver: Use an already running WebDriver (caller owns it)
         """
         self.base_url = "https://haraj.com.sa"
         self.output_dir = Path(output_dir)
         self.images_dir = self.output_dir / "images"
         self.download_images = download_images
+        self.headless = headless
         
         # Create output directories
         self.output_dir.mkdir(exist_ok=True)
         if self.download_images:
             self.images_dir.mkdir(exist_ok=True)
         
-        # Setup Chrome options
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument('--headless')
-        chrome_options.add_argument('--no-sandbox')
-        chrome_options.add_argument('--disable-dev-shm-usage')
-        chrome_options.add_argument('--disable-gpu')
-        chrome_options.add_argument('--disable-software-rasterizer')
-        chrome_options.add_argument('--disable-extensions')
-        chrome_options.add_argument('--disable-setuid-sandbox')
-        chrome_options.add_argument('--window-size=1920,1080')
-        chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
-        chrome_options.add_argument('--lang=ar,en')
-        
-        # For Railway/Linux environments, try to use system Chrome if available
-        # Check for Chrome/Chromium in standard locations (Dockerfile installs to /usr/bin)
-        chrome_binary_paths = [
-            '/usr/bin/google-chrome-stable',  # Dockerfile installs here
-            '/usr/bin/google-chrome',
-            '/usr/bin/chromium',
-            '/usr/bin/chromium-browser',
-        ]
-        
-        # Also check PATH
-        chrome_in_path = _path_which('google-chrome-stable') or _path_which('google-chrome') or _path_which('chromium')
-        if chrome_in_path:
-            chrome_binary_paths.insert(0, chrome_in_path)
-        
-        # Check nix store (if using nixpacks)
-        if os.path.exists('/nix/store'):
-            import subprocess
-            try:
-                chromium_path = subprocess.check_output(['which', 'chromium'], stderr=subprocess.DEVNULL).decode().strip()
-                if chromium_path:
-                    chrome_binary_paths.insert(0, chromium_path)
-            except:
-                pass
-        
-        # Set Chrome binary location
-        for chrome_path in chrome_binary_paths:
-            if chrome_path and os.path.exists(chrome_path):
-                chrome_options.binary_location = chrome_path
-                print(f"Using Chrome binary at: {chrome_path}")
-                break
-        
         # User agents for rotation (ToS compliance)
-        self.user_agents = [
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-            'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:121.0) Gecko/20100101 Firefox/121.0',
-        ]
+        self.user_agents = list(_USER_AGENTS)
         
         # Set random user agent
         user_agent = random.choice(self.user_agents)
-        chrome_options.add_argument(f'user-agent={user_agent}')
-        
-        # Initialize driver with better error handling for Railway
-        # Try system chromedriver first (from nixpacks), then fallback to webdriver-manager
-        chromedriver_paths = [
-            '/usr/bin/chromedriver',
-            '/usr/local/bin/chromedriver',
-            '/nix/store/*/bin/chromedriver',  # Nix store location
-        ]
-        
-        # Check for chromedriver in PATH
-        system_chromedriver = _path_which('chromedriver')
-        if system_chromedriver:
-            chromedriver_paths.append(system_chromedriver)
-        
-        # Add standard locations
-        chromedriver_paths.extend([
-            '/usr/bin/chromedriver',
-            '/usr/local/bin/chromedriver',
-            '/opt/chromedriver/chromedriver',
-        ])
-        
-        # Check nix store for chromedriver
-        nix_chromedriver_glob = '/nix/store/*/bin/chromedriver'
-        nix_matches = glob.glob(nix_chromedriver_glob)
-        if nix_matches:
-            chromedriver_paths.extend(nix_matches)
-        
-        driver_found = False
-        driver_path = None
-        
-        # Try system chromedriver first
-        for path in chromedriver_paths:
-            if os.path.exists(path):
-                try:
-                    # Make executable
-                    os.chmod(path, 0o755)
-                    # Test if it works (quick test) - but don't fail if test fails, just try to use it
-                    try:
-                        service = Service(path)
-                        test_driver = webdriver.Chrome(service=service, options=chrome_options)
-                        test_driver.quit()
-                        print(f"ChromeDriver at {path} passed test")
-                    except Exception as test_error:
-                        print(f"ChromeDriver at {path} test failed, but will try to use it anyway: {test_error}")
-                    
-                    # Use this driver (even if test failed, it might work in actual use)
-                    driver_path = path
-                    driver_found = True
-                    print(f"Using system ChromeDriver at: {path}")
-                    break
-                except Exception as path_error:
-                    print(f"Error with ChromeDriver at {path}: {path_error}")
-                    continue
-        
-        # If system chromedriver not found, use webdriver-manager
-        if not driver_found:
-            print("=" * 70)
-            print("WARNING: System ChromeDriver not found!")
-            print("This will use webdriver-manager which may have dependency issues.")
-            print("Make sure Chrome and ChromeDriver are installed.")
-            print("Checked paths:")
-            for p in chromedriver_paths[:10]:  # Show first 10
-                exists = "[OK]" if os.path.exists(p) else "[--]"
-                print(f"  {exists} {p}")
-            print("=" * 70)
-            print("Attempting to use webdriver-manager ChromeDriver...")
-            print("NOTE: This may fail with status code 127 if shared libraries are missing.")
-            print("=" * 70)
-            
-            try:
-                
-                driver_path = ChromeDriverManager().install()
-                # Make sure driver is executable (important for Linux)
-                if os.path.exists(driver_path):
-                    # Set executable permissions
-                    os.chmod(driver_path, 0o755)
-                    # Also make sure parent directories are accessible
-                    driver_dir = os.path.dirname(driver_path)
-                    depth = 0
-                    while driver_dir and driver_dir != '/' and depth < 5:
-                        if os.path.exists(driver_dir):
-                            try:
-                                os.chmod(driver_dir, 0o755)
-                            except:
-                                pass
-                        driver_dir = os.path.dirname(driver_dir)
-                        depth += 1
-                    
-                    # Verify the file is actually executable
-                    if not os.access(driver_path, os.X_OK):
-                        raise Exception(f"ChromeDriver at {driver_path} is not executable even after chmod")
-                    
-                    # Try to verify it can run (check if it's a valid binary)
-                    # This will fail with status 127 if shared libraries are missing, but we'll catch it
-                    try:
-                        import subprocess
-                        result = subprocess.run([driver_path, '--version'], 
-                                              capture_output=True, 
-                                              timeout=5,
-                                              stderr=subprocess.PIPE)
-                        if result.returncode != 0:
-                            # Check if it's a missing library error
-                            error_output = result.stderr.decode('utf-8', errors='ignore') if result.stderr else ''
-                            if 'not found' in error_output.lower() or result.returncode == 127:
-                                raise Exception(f"ChromeDriver missing shared libraries. Error: {error_output}")
-                            print(f"Warning: ChromeDriver version check failed, but continuing...")
-                    except subprocess.TimeoutExpired:
-                        print(f"Warning: ChromeDriver version check timed out")
-                    except Exception as version_check_error:
-                        error_str = str(version_check_error)
-                        if '127' in error_str or 'not found' in error_str.lower() or 'missing' in error_str.lower():
-                            # This is a dependency issue - raise it so we can provide better error
-                            raise Exception(f"ChromeDriver cannot execute due to missing dependencies: {error_str}")
-                        print(f"Warning: Could not verify ChromeDriver version: {version_check_error}")
-                    
-                    driver_found = True
-                    print(f"Using webdriver-manager ChromeDriver at: {driver_path}")
-                else:
-                    raise Exception(f"ChromeDriver path from webdriver-manager does not exist: {driver_path}")
-            except Exception as wdm_error:
-                error_msg = f"Failed to initialize ChromeDriver.\n"
-                error_msg += f"System driver not found, and webdriver-manager failed: {str(wdm_error)}\n"
-                error_msg += f"\nTroubleshooting:\n"
-                error_msg += f"1. Make sure 'chromedriver' is in nixpacks.toml nixPkgs list\n"
-                error_msg += f"2. Make sure 'chromium' is in nixpacks.toml nixPkgs list\n"
-                error_msg += f"3. Check Railway logs for chromedriver installation\n"
-                error_msg += f"4. Status code 127 usually means missing shared libraries (libnss3, etc.)"
-                raise Exception(error_msg)
         
-        # Initialize the actual driver
-        if driver_path and driver_found:
+        # Browser: checked out from a BrowserPool, passed in, or launched for this instance
+        self._pool = pool
+        self._owns_driver = pool is None and driver is None
+        if pool is not None:
+            self.driver = pool.acquire()
             try:
-                service = Service(driver_path)
-                self.driver = webdriver.Chrome(service=service, options=chrome_options)
-                print(f"ChromeDriver initialized successfully at: {driver_path}")
-            except Exception as init_error:
-                error_msg = f"Failed to start ChromeDriver at {driver_path}: {str(init_error)}"
-                error_msg += "\nMake sure:"
-                error_msg += "\n1. Chrome/Chromium is installed (check nixpacks.toml)"
-                error_msg += "\n2. ChromeDriver is installed (check nixpacks.toml)"
-                error_msg += "\n3. All required libraries are installed (libnss3, libatk-bridge2.0-0, etc.)"
-                raise Exception(error_msg)
+                self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": user_agent})
+            except Exception:
+                pass
+        elif driver is not None:
+            self.driver = driver
         else:
-            raise Exception("ChromeDriver path not found or not initialized")
-        self.driver.implicitly_wait(3)  # Reduced for speed
+            self.driver = _launch_chrome(headless=headless, user_agent=user_agent)
         
         # Session for downloading images
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': user_agent,
         })
+        # Keep connections to the image host alive across (parallel) downloads
+        adapter = HTTPAdapter(
+            pool_connections=IMAGE_DOWNLOAD_WORKERS,
+            pool_maxsize=IMAGE_DOWNLOAD_WORKERS * 2,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        if self.download_images:
+            # Open the TCP+TLS connection now so the first image download reuses it
+            try:
+                self.session.head(self.base_url, timeout=5)
+            except requests.RequestException:
+                pass
         
         # Counter for ToS compliance (change behavior every 10 listings)
         self.listing_count = 0
+        # Image download threads (see _image_executor)
+        self._image_pool = None
+        # ETag/Last-Modified per image URL (see _image_meta)
+        self._image_meta_path = None
+        # Contact-modal selector that last yielded the seller name
+        self._seller_name_selector = None
+        # Set once a contact click shows a login prompt (anonymous runs then skip the contact block)
+        self._contact_requires_login = False
+        # Pool-backed scrapers used by scrape_listings_parallel(), kept across calls until close()
+        self._workers = []
         
         # Login credentials (optional)
         self.username = username
@@ -375,24 +782,46 @@ class HarajScraperSelenium:
         if not self.use_compliance_delays:
             return
         if self.listing_count > 0 and self.listing_count % 10 == 0:
-            print(f"\n[ToS Compliance] Applied measures after {self.listing_count} listings...")
+            logger.info("[ToS Compliance] Applied measures after %d listings...", self.listing_count)
             # Extended delay 30-60 seconds (per TOS_COMPLIANCE.md) - reduces server load and block risk
             delay = random.randint(30, 60)
-            print(f"  - Extended delay: {delay} seconds")
+            logger.info("  - Extended delay: %s seconds", delay)
             time.sleep(delay)
-            # Clear cookies every 20 listings
+            # Clear cookies every 20 listings (keeping the login session)
             if self.listing_count % 20 == 0:
-                self.driver.delete_all_cookies()
-                print("  - Cookies cleared")
+                cleared = self._clear_non_auth_cookies()
+                logger.info("  - Cookies cleared (%s)", cleared)
             # Rotate user agent
             if self.listing_count % 30 == 0:
                 user_agent = random.choice(self.user_agents)
                 try:
                     self.driver.execute_cdp_cmd('Network.setUserAgentOverride', {"userAgent": user_agent})
-                    print("  - User-Agent rotated")
+                    logger.info("  - User-Agent rotated")
                 except Exception:
                     pass
-            print("  - Continuing scraping...\n")
+            logger.info("  - Continuing scraping...")
+    
+    def _clear_non_auth_cookies(self) -> int:
+        """Delete every browser cookie except login/session ones; returns how many were deleted."""
+        deleted = 0
+        try:
+            cookies = self.driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+            for cookie in cookies:
+                if _AUTH_COOKIE_RE.search(cookie.get('name', '')):
+                    continue
+                self.driver.execute_cdp_cmd('Network.deleteCookies', {
+                    'name': cookie['name'],
+                    'domain': cookie.get('domain'),
+                    'path': cookie.get('path', '/'),
+                })
+                deleted += 1
+        except Exception:
+            # No CDP: fall back to the current domain's cookies via WebDriver
+            for cookie in self.driver.get_cookies():
+                if not _AUTH_COOKIE_RE.search(cookie.get('name', '')):
+                    self.driver.delete_cookie(cookie['name'])
+                    deleted += 1
+        return deleted
     
     def login(self):
         """Login to Haraj.com.sa if credentials are provided"""
@@ -400,7 +829,7 @@ class HarajScraperSelenium:
             return False
         
         try:
-            print("Attempting to login to Haraj.com.sa...")
+            logger.info("Attempting to login to Haraj.com.sa...")
             self.driver.get("https://haraj.com.sa")
             time.sleep(2)
             
@@ -414,20 +843,23 @@ class HarajScraperSelenium:
             login_button = None
             for selector in login_selectors:
                 try:
-                    buttons = self.driver.find_elements(By.XPATH, selector)
-                    if buttons:
-                        login_button = buttons[0]
-                        break
+                    login_button = self.driver.find_element(By.XPATH, selector)
+                    break
                 except:
                     continue
             
             if not login_button:
-                print("  Warning: Could not find login button. Proceeding without login.")
+                logger.warning("Could not find login button. Proceeding without login.")
                 return False
             
-            # Click login button
+            # Click login button and wait for the login form
             login_button.click()
-            time.sleep(2)
+            try:
+                WebDriverWait(self.driver, 5, poll_frequency=0.05).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="password"]'))
+                )
+            except Exception:
+                pass
             
             # Find username/email field
             username_fields = self.driver.find_elements(By.XPATH, 
@@ -436,8 +868,7 @@ class HarajScraperSelenium:
                 username_fields = self.driver.find_elements(By.XPATH, "//input[contains(@placeholder, 'البريد') or contains(@placeholder, 'اسم')]")
             
             # Find password field
-            password_fields = self.driver.find_elements(By.XPATH, 
-                "//input[@type='password']")
+            password_fields = self.driver.find_elements(By.CSS_SELECTOR, 'input[type="password"]')
             
             if username_fields and password_fields:
                 username_fields[0].send_keys(self.username)
@@ -446,10 +877,13 @@ class HarajScraperSelenium:
                 time.sleep(0.5)
                 
                 # Find and click submit button
-                submit_buttons = self.driver.find_elements(By.XPATH,
-                    "//button[@type='submit'] | //button[contains(text(), 'دخول')] | //input[@type='submit']")
-                if submit_buttons:
-                    submit_buttons[0].click()
+                try:
+                    submit_button = self.driver.find_element(By.XPATH,
+                        "//button[@type='submit'] | //button[contains(text(), 'دخول')] | //input[@type='submit']")
+                except NoSuchElementException:
+                    submit_button = None
+                if submit_button:
+                    submit_button.click()
                     time.sleep(3)
                     
                     # Check if login was successful
@@ -459,47 +893,79 @@ class HarajScraperSelenium:
                     
                     if profile_indicators or 'haraj.com.sa' in self.driver.current_url:
                         self.is_logged_in = True
-                        print("  [OK] Login successful!")
+                        logger.info("  [OK] Login successful!")
                         return True
                     else:
-                        print("  [--] Login may have failed. Check credentials.")
+                        logger.warning("  [--] Login may have failed. Check credentials.")
                         return False
                 else:
-                    print("  ✗ Could not find submit button")
+                    logger.warning("  ✗ Could not find submit button")
                     return False
             else:
-                print("  [--] Could not find login form fields")
+                logger.warning("  [--] Could not find login form fields")
                 return False
                 
         except Exception as e:
-            print(f"  [--] Login error: {e}")
+            logger.error("  [--] Login error: %s", e)
             return False
     
     def get_page(self, url: str) -> Optional[BeautifulSoup]:
-        """Load page with Selenium and return BeautifulSoup. Includes ToS-friendly wait."""
+        """Load page with Selenium and return BeautifulSoup as soon as the listing content has rendered."""
+        if not self._load_page(url):
+            return None
+        return self._page_soup()
+    
+    def _wait_for_listing_content(self, timeout: float = 6):
+        """Block until the listing title or article has rendered (or timeout)."""
         try:
-            self.driver.get(url)
-            # ToS: 2-4 second wait after page load (human-like, gives DOM time to render)
-            time.sleep(random.uniform(2, 4))
-            try:
-                WebDriverWait(self.driver, 3).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
+            WebDriverWait(self.driver, timeout, poll_frequency=0.05).until(
+                EC.any_of(
+                    EC.presence_of_element_located((By.TAG_NAME, "h1")),
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "article[data-testid='post-article']"))
                 )
-            except Exception:
-                pass
-            page_source = self.driver.page_source
-            return BeautifulSoup(page_source, 'html.parser')
+            )
+        except Exception:
+            pass
+    
+    def _load_page(self, url: str) -> bool:
+        """Navigate to url and wait for the listing content (no page_source transfer)."""
+        try:
+            self.driver.get(url)
+            self._wait_for_listing_content()
+            # ToS (logged in): 2-4 second human-like pause on the page
+            if self.use_compliance_delays:
+                time.sleep(random.uniform(2, 4))
+            return True
         except Exception as e:
-            print(f"Error loading {url}: {e}")
+            logger.error("Error loading %s: %s", url, e)
+            return False
+    
+    def _page_soup(self) -> Optional[BeautifulSoup]:
+        """Serialize the current DOM (page_source) and parse it with BeautifulSoup."""
+        try:
+            return BeautifulSoup(self.driver.page_source, _HTML_PARSER)
+        except Exception as e:
+            logger.error("Error reading page source: %s", e)
             return None
     
     def extract_listing_id(self, url: str) -> Optional[str]:
         """Extract listing ID from URL"""
-        match = re.search(r'/(\d+)/', url)
-        return match.group(1) if match else None
+        return _listing_id_from_url(url)
     
-    def extract_listing_details(self, soup: BeautifulSoup, url: str) -> Dict:
-        """Extract all details from a listing page"""
+    def _harvest_listing_dom(self) -> Dict:
+        """Collect every read-only listing field from the rendered DOM in a single execute_script call."""
+        try:
+            return self.driver.execute_script(_LISTING_HARVEST_JS, _PRICE_XPATHS, _TAG_CONTENT_XPATHS) or {}
+        except Exception as e:
+            logger.warning("DOM harvest failed: %s", e)
+            return {}
+
+    def extract_listing_details(self, soup: Optional[BeautifulSoup], url: str) -> Dict:
+        """
+        Extract all details from the listing page currently loaded in the browser.
+        soup is optional: fields come from the JS DOM harvest, and page_source is only
+        parsed when no soup is given and the harvest found neither title nor description.
+        """
         listing_data = {
             'url': url,
             'listing_id': self.extract_listing_id(url),
@@ -517,205 +983,151 @@ class HarajScraperSelenium:
             'contact_info': {},
         }
         
-        if not soup:
-            return listing_data
-        
-        # Extract title - try multiple methods (strip script/style so no raw script appears)
-        title_elem = soup.find('h1')
+        # All read-only fields in one WebDriver round trip (contact info below still needs clicks)
+        harvest = self._harvest_listing_dom()
+        if soup is None and not (harvest.get('title') or harvest.get('description')):
+            soup = self._page_soup()
+            if soup is None:
+                return listing_data
+
+        # Extract title - prefer soup (strip script/style so no raw script appears), else rendered DOM
+        title_elem = soup.find('h1') if soup is not None else None
         if title_elem:
-            title_soup = BeautifulSoup(str(title_elem), 'html.parser')
-            root = title_soup.find()
-            if root:
-                _strip_script_and_style(root)
-            listing_data['title'] = _sanitize_text(title_soup.get_text(strip=True), max_length=2000)
-        else:
-            # Try using Selenium to find title
-            try:
-                title_elements = self.driver.find_elements(By.TAG_NAME, "h1")
-                if title_elements:
-                    listing_data['title'] = _sanitize_text(title_elements[0].text.strip(), max_length=2000)
-                else:
-                    # Try data-testid
-                    title_elements = self.driver.find_elements(By.XPATH, "//*[@data-testid='post_title']")
-                    if title_elements:
-                        listing_data['title'] = _sanitize_text(title_elements[0].text.strip(), max_length=2000)
-            except Exception:
-                pass
+            # Strip a detached copy (copies the parsed tree, no re-serialize/re-parse of the HTML)
+            title_copy = copy.copy(title_elem)
+            _strip_script_and_style(title_copy)
+            listing_data['title'] = _sanitize_text(title_copy.get_text(strip=True), max_length=2000)
+        elif harvest.get('title'):
+            listing_data['title'] = _sanitize_text(harvest['title'], max_length=2000)
 
         # Extract description/article content - strip script/style so no raw script appears
-        article = soup.find('article')
+        article = soup.find('article') if soup is not None else None
         if article:
-            article_soup = BeautifulSoup(str(article), 'html.parser')
-            root = article_soup.find()
-            if root:
-                _strip_script_and_style(root)
-            listing_data['description'] = _sanitize_text(article_soup.get_text(strip=True), max_length=50000)
-        else:
-            # Try using Selenium
-            try:
-                article_elements = self.driver.find_elements(By.XPATH, "//article[@data-testid='post-article']")
-                if article_elements:
-                    listing_data['description'] = _sanitize_text(article_elements[0].text.strip(), max_length=50000)
-                else:
-                    # Try any article tag
-                    article_elements = self.driver.find_elements(By.TAG_NAME, "article")
-                    if article_elements:
-                        listing_data['description'] = _sanitize_text(article_elements[0].text.strip(), max_length=50000)
-            except Exception:
-                pass
+            article_copy = copy.copy(article)
+            _strip_script_and_style(article_copy)
+            listing_data['description'] = _sanitize_text(article_copy.get_text(strip=True), max_length=50000)
+        elif harvest.get('description'):
+            listing_data['description'] = _sanitize_text(harvest['description'], max_length=50000)
         
-        # Extract price - multiple methods for Haraj
-        try:
-            # Method 1: data-testid / aria (Haraj may use these)
-            for selector in [
-                "//*[contains(@data-testid, 'price') or @data-testid='post_price']",
-                "//*[@aria-label and (contains(@aria-label, 'ريال') or contains(@aria-label, 'السعر'))]",
-                "//*[contains(@class, 'price') and (contains(., 'ريال') or contains(., 'ر.س'))]",
-                "//*[contains(text(), 'ريال') or contains(text(), 'ر.س')]",
-            ]:
-                price_elems = self.driver.find_elements(By.XPATH, selector)
-                for elem in price_elems:
-                    text = (elem.text or '').strip()
-                    if text and re.search(r'\d+', text) and ('ريال' in text or 'ر.س' in text):
-                        listing_data['price'] = text
-                        break
-                if listing_data['price']:
+        # Extract price - candidates per selector (data-testid/aria/class/text), in priority order
+        for texts in harvest.get('price_candidates') or []:
+            for text in texts:
+                text = (text or '').strip()
+                if text and _DIGITS_RE.search(text) and ('ريال' in text or 'ر.س' in text):
+                    listing_data['price'] = text
                     break
-            # Method 2: Soup fallback - regex in page text (must include digits)
-            if not listing_data['price'] and soup:
-                page_text = soup.get_text() if hasattr(soup, 'get_text') else str(soup)
-                price_match = re.search(r'[\d,]+\s*(?:ريال|ر\.س)', page_text)
-                if price_match:
-                    listing_data['price'] = price_match.group(0).strip()
-        except Exception:
-            pass
+            if listing_data['price']:
+                break
+        # Soup fallback - regex in page text (must include digits)
+        if not listing_data['price'] and soup is not None:
+            page_text = soup.get_text() if hasattr(soup, 'get_text') else str(soup)
+            price_match = _PRICE_TEXT_RE.search(page_text)
+            if price_match:
+                listing_data['price'] = price_match.group(0).strip()
 
         # Extract location/city
-        try:
-            city_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/city/')]")
-            if city_elements:
-                listing_data['city'] = city_elements[0].text.strip()
-                listing_data['location'] = listing_data['city']
-            if not listing_data['city'] and soup:
-                city_link = soup.find('a', href=re.compile(r'/city/'))
-                if city_link:
-                    listing_data['city'] = city_link.get_text(strip=True)
-                    listing_data['location'] = listing_data['city']
-        except Exception:
-            pass
+        listing_data['city'] = (harvest.get('city') or '').strip()
+        if not listing_data['city'] and soup is not None:
+            city_link = soup.find('a', href=_CITY_HREF_RE)
+            if city_link:
+                listing_data['city'] = city_link.get_text(strip=True)
+        listing_data['location'] = listing_data['city']
 
         # Extract posted time / publication date - only short time strings, never JSON-LD
-        try:
-            def set_posted_time(val):
-                v = (val or '').strip()
-                if _valid_posted_time(v):
-                    listing_data['posted_time'] = v
-                    return True
-                listing_data['posted_time'] = ''
-                return False
+        def set_posted_time(val):
+            v = (val or '').strip()
+            if _valid_posted_time(v):
+                listing_data['posted_time'] = v
+                return True
+            listing_data['posted_time'] = ''
+            return False
 
-            # Method 1: time element (datetime attribute is ideal) - datetime is ISO, keep short
-            time_elems = self.driver.find_elements(By.XPATH, "//time[@datetime]")
-            if time_elems:
-                dt = time_elems[0].get_attribute('datetime')
-                if dt and _valid_posted_time(dt):
-                    listing_data['posted_time'] = dt
-                elif not listing_data['posted_time']:
-                    set_posted_time(time_elems[0].text)
-            if not listing_data['posted_time']:
-                time_elems = self.driver.find_elements(By.XPATH,
-                    "//*[contains(@data-testid, 'time') or contains(@data-testid, 'date')]")
-                if time_elems:
-                    set_posted_time(time_elems[0].text)
-            if not listing_data['posted_time']:
-                time_elems = self.driver.find_elements(By.XPATH,
-                    "//*[contains(text(), 'الآن') or contains(text(), 'منذ') or contains(text(), 'قبل')]")
-                for elem in time_elems:
-                    text = (elem.text or '').strip()
-                    if text and len(text) < 50 and set_posted_time(text):
-                        break
-            # Method 2: Soup fallback - only if parent is not script (avoid JSON-LD)
-            if not listing_data['posted_time'] and soup:
-                for s in soup.find_all(string=re.compile(r'الآن|منذ|قبل|ago', re.IGNORECASE)):
-                    t = s.strip() if hasattr(s, 'strip') else str(s).strip()
-                    if _valid_posted_time(t):
-                        parent = s.parent if hasattr(s, 'parent') else None
-                        if parent and parent.name and parent.name.lower() == 'script':
-                            continue
-                        listing_data['posted_time'] = t
-                        break
-        except Exception:
-            pass
+        # Method 1: time element (datetime attribute is ideal), data-testid, relative-time text
+        dt = harvest.get('time_datetime')
+        if dt and _valid_posted_time(dt):
+            listing_data['posted_time'] = dt
+        elif harvest.get('time_text'):
+            set_posted_time(harvest['time_text'])
+        if not listing_data['posted_time'] and harvest.get('time_testid_text'):
+            set_posted_time(harvest['time_testid_text'])
+        if not listing_data['posted_time']:
+            for text in harvest.get('time_relative_texts') or []:
+                text = (text or '').strip()
+                if text and len(text) < 50 and set_posted_time(text):
+                    break
+        # Method 2: Soup fallback - only if parent is not script (avoid JSON-LD)
+        if not listing_data['posted_time'] and soup is not None:
+            for s in soup.find_all(string=_RELATIVE_TIME_RE):
+                t = s.strip() if hasattr(s, 'strip') else str(s).strip()
+                if _valid_posted_time(t):
+                    parent = s.parent if hasattr(s, 'parent') else None
+                    if parent and parent.name and parent.name.lower() == 'script':
+                        continue
+                    listing_data['posted_time'] = t
+                    break
         
         # Extract seller information
-        try:
-            seller_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/users/')]")
-            if seller_elements:
-                listing_data['seller_name'] = seller_elements[0].text.strip()
-                listing_data['seller_url'] = urljoin(self.base_url, seller_elements[0].get_attribute('href'))
-        except:
-            pass
+        if harvest.get('seller_href'):
+            listing_data['seller_name'] = (harvest.get('seller_name') or '').strip()
+            listing_data['seller_url'] = urljoin(self.base_url, harvest['seller_href'])
         
         # Extract category and tags - only from listing content to avoid nav/breadcrumb (e.g. "Car auction")
-        try:
-            tags = []
-            seen = set()
-            # Prefer tags inside main content (article, main, or post container) so we get listing-specific tags
-            content_selectors = [
-                "//article//a[contains(@href, '/tags/')]",
-                "//main//a[contains(@href, '/tags/')]",
-                "//*[contains(@data-testid, 'post') or contains(@class, 'post') or contains(@class, 'listing')]//a[contains(@href, '/tags/')]",
-                "//*[@data-testid='post-article']/..//a[contains(@href, '/tags/')]",  # parent of article
-            ]
-            for selector in content_selectors:
-                tag_elements = self.driver.find_elements(By.XPATH, selector)
-                for elem in tag_elements:
-                    tag_text = (elem.text or '').strip()
-                    if tag_text and tag_text not in seen:
-                        tags.append(tag_text)
-                        seen.add(tag_text)
-            # Fallback: all /tags/ links on page, but then prefer non-"حراج السيارات" for category
-            if not tags:
-                tag_elements = self.driver.find_elements(By.XPATH, "//a[contains(@href, '/tags/')]")
-                for elem in tag_elements:
-                    tag_text = (elem.text or '').strip()
-                    if tag_text and tag_text not in seen:
-                        tags.append(tag_text)
-                        seen.add(tag_text)
-            listing_data['tags'] = tags
-            if tags:
-                # Use first listing-specific tag; skip generic "حراج السيارات" if we have others
-                generic_car = 'حراج السيارات'
-                non_generic = [t for t in tags if t != generic_car]
-                listing_data['category'] = (non_generic[0] if non_generic else tags[0])
-        except Exception:
-            pass
+        tags = []
+        seen = set()
+        for texts in harvest.get('tag_groups') or []:
+            for tag_text in texts:
+                tag_text = (tag_text or '').strip()
+                if tag_text and tag_text not in seen:
+                    tags.append(tag_text)
+                    seen.add(tag_text)
+        # Fallback: all /tags/ links on page, but then prefer non-"حراج السيارات" for category
+        if not tags:
+            for tag_text in harvest.get('all_tags') or []:
+                tag_text = (tag_text or '').strip()
+                if tag_text and tag_text not in seen:
+                    tags.append(tag_text)
+                    seen.add(tag_text)
+        listing_data['tags'] = tags
+        if tags:
+            # Use first listing-specific tag; skip generic "حراج السيارات" if we have others
+            generic_car = 'حراج السيارات'
+            non_generic = [t for t in tags if t != generic_car]
+            listing_data['category'] = (non_generic[0] if non_generic else tags[0])
         
-        # Extract images - use Selenium to find all images
-        try:
-            img_elements = self.driver.find_elements(By.TAG_NAME, "img")
-            images = []
-            for img in img_elements:
-                src = img.get_attribute('src') or img.get_attribute('data-src') or img.get_attribute('data-lazy-src')
-                if src:
-                    # Filter out icons, logos, and small images
-                    if any(exclude in src.lower() for exclude in ['icon', 'logo', 'badge', 'avatar']):
-                        continue
-                    # Make absolute URL
-                    img_url = urljoin(self.base_url, src)
-                    if img_url not in images:
-                        images.append(img_url)
-            listing_data['images'] = images
-        except Exception as e:
-            print(f"Error extracting images: {e}")
+        # Extract images
+        images = []
+        seen_images = set()
+        for src in harvest.get('images') or []:
+            # Filter out icons, logos, and small images
+            if _IMG_EXCLUDE_RE.search(src):
+                continue
+            # Already absolute (resolved against document.baseURI in the harvest)
+            if src not in seen_images:
+                seen_images.add(src)
+                images.append(src)
+        listing_data['images'] = images
+        
+        # Contact needs login on this site and we are not logged in: skip the click/modal round trip
+        if self._contact_requires_login and not self.is_logged_in:
+            listing_data['contact_info']['login_required'] = True
+            return listing_data
         
         # Extract contact information by clicking contact button - ULTRA OPTIMIZED
         try:
             # Find contact button - try multiple selectors for better detection
-            contact_buttons = self.driver.find_elements(By.XPATH, 
-                "//button[contains(@data-testid, 'contact') or contains(text(), 'تواصل') or contains(@class, 'contact')] | " +
-                "//a[contains(@class, 'contact') or contains(text(), 'تواصل')] | " +
-                "//*[@role='button' and (contains(text(), 'تواصل') or contains(@data-testid, 'contact'))]")
+            contact_xpath = (
+                "//button[contains(@data-testid, 'contact') or contains(text(), 'تواصل') or contains(@class, 'contact')] | "
+                "//a[contains(@class, 'contact') or contains(text(), 'تواصل')] | "
+                "//*[@role='button' and (contains(text(), 'تواصل') or contains(@data-testid, 'contact'))]"
+            )
+            # The button can render a moment after the title; give it a short explicit wait
+            try:
+                WebDriverWait(self.driver, 2, poll_frequency=0.05).until(
+                    EC.presence_of_element_located((By.XPATH, contact_xpath))
+                )
+            except Exception:
+                pass
+            contact_buttons = self.driver.find_elements(By.XPATH, contact_xpath)
             
             if not contact_buttons:
                 # Try alternative: look for any clickable element with contact-related text
@@ -729,138 +1141,78 @@ class HarajScraperSelenium:
                 try:
                     # Click directly without scrolling (faster)
                     self.driver.execute_script("arguments[0].click();", contact_buttons[0])
-                    time.sleep(0.5)  # Minimal wait for modal to appear
+                    
+                    # Wait for the contact modal/info (or a login prompt) to appear
+                    try:
+                        WebDriverWait(self.driver, 1.5, poll_frequency=0.05).until(
+                            EC.any_of(
+                                EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="modal"], [class*="dialog"], [role*="dialog"]')),
+                                EC.presence_of_element_located((By.CSS_SELECTOR, 'a[href^="tel:"]')),
+                                EC.presence_of_element_located((By.CSS_SELECTOR, '[class*="phone"], [class*="contact-info"]')),
+                                EC.presence_of_element_located((By.XPATH, "//*[contains(text(), 'تسجيل الدخول') or contains(text(), 'يجب تسجيل الدخول') or contains(text(), 'login')]"))
+                            )
+                        )
+                    except:
+                        pass
                     
                     # Check if login prompt appeared instead of contact info
                     login_prompts = self.driver.find_elements(By.XPATH,
                         "//*[contains(text(), 'تسجيل الدخول') or contains(text(), 'يجب تسجيل الدخول') or contains(text(), 'login')]")
                     if login_prompts and not self.is_logged_in:
-                        print("  ⚠️  Login required to view contact information")
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("  Login required to view contact information")
                         listing_data['contact_info']['login_required'] = True
+                        self._contact_requires_login = True
                         # Try to close the login prompt
                         try:
-                            self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                            time.sleep(0.2)
+                            self.driver.execute_script(_CLOSE_MODAL_JS)
                         except:
                             pass
                         return listing_data
                     
-                    # Wait for modal/contact info to appear - faster detection
-                    try:
-                        WebDriverWait(self.driver, 1.5).until(
-                            EC.any_of(
-                                EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'modal') or contains(@class, 'dialog') or contains(@role, 'dialog')]")),
-                                EC.presence_of_element_located((By.XPATH, "//a[starts-with(@href, 'tel:')]")),
-                                EC.presence_of_element_located((By.XPATH, "//*[contains(@class, 'phone') or contains(@class, 'contact-info')]"))
-                            )
-                        )
-                    except:
-                        time.sleep(0.3)  # Brief wait if modal detection fails
-                    
                     # Extract seller name and phone from contact modal
                     seller_phone = None
                     seller_name_from_contact = None
                     
-                    # Find the contact modal/dialog container
-                    modal_container = None
+                    # Modal container text, tel:/WhatsApp links and name element in one round trip
                     try:
-                        # Try to find modal by various selectors
-                        modal_selectors = [
-                            "//div[contains(@class, 'modal') or contains(@class, 'dialog') or contains(@role, 'dialog')]",
-                            "//div[contains(@data-testid, 'contact') or contains(@data-testid, 'modal')]",
-                            "//*[contains(@class, 'contact-info') or contains(@class, 'contact-details')]",
-                        ]
-                        for selector in modal_selectors:
-                            modals = self.driver.find_elements(By.XPATH, selector)
-                            if modals:
-                                modal_container = modals[0]
-                                break
-                    except:
-                        pass
+                        modal = self.driver.execute_script(
+                            _CONTACT_MODAL_JS, _CONTACT_MODAL_SELECTORS, self._seller_name_selectors()
+                        ) or {}
+                    except Exception:
+                        modal = {}
                     
                     # Method 1: Extract from tel: links (most reliable for phone)
-                    try:
-                        phone_links = self.driver.find_elements(By.XPATH, "//a[starts-with(@href, 'tel:')]")
-                        if phone_links:
-                            href = phone_links[0].get_attribute('href')
-                            phone_match = re.search(r'tel:[\+]?(\d+)', href)
-                            if phone_match:
-                                phone = phone_match.group(1)
-                                # Remove country code (966)
-                                if phone.startswith('966') and len(phone) > 9:
-                                    phone = phone[3:]
-                                elif phone.startswith('+966'):
-                                    phone = phone[4:]
-                                if len(phone) >= 9:
-                                    seller_phone = phone
-                    except:
-                        pass
+                    phone_match = _TEL_RE.search(modal.get('tel_href') or '')
+                    if phone_match:
+                        seller_phone = _normalize_phone(phone_match.group(1))
                     
                     # Method 2: Extract from modal container text (phone and name)
-                    if modal_container:
-                        try:
-                            modal_text = modal_container.text
-                            
-                            # Extract seller name - look for name patterns in modal
-                            # Usually appears before phone number
-                            name_patterns = [
-                                r'([أ-ي\s]{3,})',  # Arabic name (3+ Arabic chars)
-                                r'([A-Za-z\s]{3,})',  # English name
-                            ]
-                            for pattern in name_patterns:
-                                name_matches = re.findall(pattern, modal_text)
+                    if modal.get('modal_found'):
+                        modal_text = modal.get('modal_text') or ''
+                        
+                        # Extract seller name - dedicated name element first, else
+                        # name patterns in modal text (usually appears before phone number)
+                        seller_name_from_contact = self._modal_seller_name(modal.get('name'))
+                        if not seller_name_from_contact:
+                            for pattern in _NAME_PATTERNS:
+                                name_matches = pattern.findall(modal_text)
                                 if name_matches:
                                     # Take first reasonable name (not too long, not phone-like)
                                     for match in name_matches[:3]:
                                         name = match.strip()
-                                        if 3 <= len(name) <= 50 and not re.match(r'^\d+$', name):
+                                        if _plausible_name(name):
                                             seller_name_from_contact = name
                                             break
                                 if seller_name_from_contact:
                                     break
-                            
-                            # Extract phone from modal text
-                            if not seller_phone:
-                                phone_patterns = [
-                                    r'(\+966[\d\s-]{9,})',  # +966 format
-                                    r'(05[\d\s-]{9,})',     # 05 format (9 digits after 05)
-                                    r'(5[\d\s-]{9,})',      # 5 format
-                                ]
-                                for pattern in phone_patterns:
-                                    matches = re.findall(pattern, modal_text)
-                                    if matches:
-                                        phone = re.sub(r'[\s-]', '', str(matches[0]))
-                                        # Remove country code
-                                        if phone.startswith('966') and len(phone) > 9:
-                                            phone = phone[3:]
-                                        elif phone.startswith('+966'):
-                                            phone = phone[4:]
-                                        if len(phone) >= 9:
-                                            seller_phone = phone
-                                            break
-                        except:
-                            pass
-                    
-                    # Method 3: Look for phone in specific elements within modal
-                    if not seller_phone and modal_container:
-                        try:
-                            phone_elements = modal_container.find_elements(By.XPATH, 
-                                ".//*[contains(text(), '05') or contains(text(), '+966') or contains(text(), '5')]")
-                            
-                            for elem in phone_elements[:3]:
-                                text = elem.text.strip()
-                                phone_match = re.search(r'(\+?966[\d\s-]{9,}|05[\d\s-]{9,}|5[\d\s-]{9,})', text)
-                                if phone_match:
-                                    phone = re.sub(r'[\s-]', '', phone_match.group(1))
-                                    if phone.startswith('966') and len(phone) > 9:
-                                        phone = phone[3:]
-                                    elif phone.startswith('+966'):
-                                        phone = phone[4:]
-                                    if len(phone) >= 9:
-                                        seller_phone = phone
-                                        break
-                        except:
-                            pass
+                        
+                        # Extract phone from modal text (first number that normalizes cleanly)
+                        if not seller_phone:
+                            for phone_match in _PHONE_RE.finditer(modal_text):
+                                seller_phone = _normalize_phone(phone_match.group(0))
+                                if seller_phone:
+                                    break
                     
                     # Store extracted contact info
                     if seller_phone:
@@ -874,44 +1226,93 @@ class HarajScraperSelenium:
                         if not listing_data.get('seller_name'):
                             listing_data['seller_name'] = seller_name_from_contact
                     
-                    # Try to find WhatsApp link in modal
-                    try:
-                        whatsapp_links = self.driver.find_elements(By.XPATH, 
-                            "//a[contains(@href, 'wa.me') or contains(@href, 'whatsapp')]")
-                        if whatsapp_links:
-                            listing_data['contact_info']['whatsapp_available'] = True
-                            listing_data['contact_info']['whatsapp_link'] = whatsapp_links[0].get_attribute('href')
-                    except:
-                        pass
+                    # WhatsApp link in modal
+                    if modal.get('whatsapp_href'):
+                        listing_data['contact_info']['whatsapp_available'] = True
+                        listing_data['contact_info']['whatsapp_link'] = modal['whatsapp_href']
                     
-                    # Close modal quickly (use ESC key or close button)
+                    # Close modal (removing the nodes is synchronous, no settle time needed)
                     try:
-                        # Try ESC key first (fastest)
-                        self.driver.find_element(By.TAG_NAME, 'body').send_keys(Keys.ESCAPE)
-                        time.sleep(0.1)
+                        self.driver.execute_script(_CLOSE_MODAL_JS)
                     except:
-                        # Fallback to close button
-                        try:
-                            close_buttons = self.driver.find_elements(By.XPATH, 
-                                "//button[contains(@class, 'close') or contains(@aria-label, 'close') or contains(text(), '×')]")
-                            if close_buttons:
-                                close_buttons[0].click()
-                                time.sleep(0.1)
-                        except:
-                            pass
+                        pass
                         
                 except Exception as e:
-                    print(f"  Warning: Could not extract contact info: {e}")
+                    logger.warning("Could not extract contact info: %s", e)
                     
         except Exception as e:
-            print(f"  Warning: Error extracting contact info: {e}")
+            logger.warning("Error extracting contact info: %s", e)
         
         return listing_data
     
+    def _seller_name_selectors(self) -> List[str]:
+        """Seller-name selectors for the contact modal, the one that matched last time first."""
+        selectors = list(_SELLER_NAME_SELECTORS)
+        if self._seller_name_selector in selectors:
+            selectors.remove(self._seller_name_selector)
+            selectors.insert(0, self._seller_name_selector)
+        return selectors
+    
+    def _modal_seller_name(self, found) -> Optional[str]:
+        """Seller name from the modal's name element ([selector, text] from _CONTACT_MODAL_JS), if plausible."""
+        if not found:
+            return None
+        selector, name = found[0], (found[1] or '').strip()
+        if not _plausible_name(name):
+            return None
+        self._seller_name_selector = selector
+        return name
+    
+    def _image_executor(self) -> ThreadPoolExecutor:
+        """Download threads shared by all listings of this scraper (started on first use)."""
+        if self._image_pool is None:
+            self._image_pool = ThreadPoolExecutor(max_workers=IMAGE_DOWNLOAD_WORKERS, thread_name_prefix='haraj-img')
+        return self._image_pool
+    
+    def _image_meta(self, img_url: str, update: Dict = None) -> Optional[Dict]:
+        """
+        Validators of downloaded images ({'etag', 'lm', 'path'} per URL), kept across runs in
+        output_dir/img_etags.db. Returns the entry for img_url, storing `update` first if given.
+        The shelf is shared by every open scraper writing to the same output_dir.
+        """
+        with _image_meta_lock:
+            if self._image_meta_path is None:
+                path = str(self.output_dir / 'img_etags.db')
+                entry = _image_meta_dbs.get(path)
+                if entry is None:
+                    entry = _image_meta_dbs[path] = [shelve.open(path), 0]
+                entry[1] += 1
+                self._image_meta_path = path
+            db = _image_meta_dbs[self._image_meta_path][0]
+            if update is not None:
+                db[img_url] = update
+            return db.get(img_url)
+    
     def download_image(self, img_url: str, listing_id: str, index: int) -> Optional[str]:
-        """Download an image and return local path"""
+        """
+        Download an image and return local path. Revalidated with a conditional GET if it was
+        downloaded before with an ETag/Last-Modified; without one an existing file is reused as-is.
+        """
         try:
-            response = self.session.get(img_url, timeout=30, stream=True)
+            headers = {}
+            meta = self._image_meta(img_url)
+            if meta and os.path.exists(meta.get('path', '')):
+                if meta.get('etag'):
+                    headers['If-None-Match'] = meta['etag']
+                if meta.get('lm'):
+                    headers['If-Modified-Since'] = meta['lm']
+            else:
+                # Extension depends on the response content type, so check each one we write (a few
+                # stats; globbing would list the whole images dir per image)
+                for ext in _IMAGE_EXTENSIONS:
+                    existing = self.images_dir / f"{listing_id}_{index}.{ext}"
+                    if existing.exists():
+                        return str(existing)
+            response = self.session.get(img_url, timeout=30, stream=True, headers=headers)
+            if response.status_code == 304 and headers:
+                # Unchanged since last download: keep the existing file
+                response.close()
+                return meta['path']
             response.raise_for_status()
             
             # Determine file extension
@@ -929,13 +1330,17 @@ class HarajScraperSelenium:
             filepath = self.images_dir / filename
             
             # Save image
+            # Copy in C with a 1 MB buffer; decode_content undoes any gzip/deflate Content-Encoding
+            response.raw.decode_content = True
             with open(filepath, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
             
+            etag, last_modified = response.headers.get('ETag'), response.headers.get('Last-Modified')
+            if etag or last_modified:
+                self._image_meta(img_url, {'etag': etag, 'lm': last_modified, 'path': str(filepath)})
             return str(filepath)
         except Exception as e:
-            print(f"Error downloading image {img_url}: {e}")
+            logger.error("Error downloading image %s: %s", img_url, e)
             return None
     
     def scrape_listing(self, listing_url: str) -> Dict:
@@ -943,46 +1348,125 @@ class HarajScraperSelenium:
         # Apply ToS compliance measures every 10 listings
         self._apply_tos_compliance_measures()
         
-        print(f"Scraping: {listing_url}")
-        # With login: ToS 2-5s between listings. Without login: fast 0.15-0.4s (no account risk).
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scraping: %s", listing_url)
+        # With login: ToS 2-5s between listings. Without login: only the per-host rate limit (no account risk).
         if self.use_compliance_delays:
-            delay = random.uniform(2, 5)
+            time.sleep(random.uniform(2, 5))
         else:
-            delay = random.uniform(0.15, 0.4)
-        time.sleep(delay)
+            _throttle(listing_url)
         
-        soup = self.get_page(listing_url)
-        if not soup:
+        if not self._load_page(listing_url):
             self.listing_count += 1
-            print(f"  Warning: Failed to load page for {listing_url}")
+            logger.warning("Failed to load page for %s", listing_url)
             return {}
         
-        listing_data = self.extract_listing_details(soup, listing_url)
+        return self._scrape_loaded_listing(listing_url)
+    
+    def scrape_listings(self, listing_urls: List[str], tabs: int = LISTING_TABS,
+                        on_listing: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        Scrape several listings, loading up to `tabs` of them at once in separate browser tabs.
+        Returns one dict per URL (empty when the page failed to load). With login (ToS delays)
+        listings are scraped one at a time. `on_listing` is called with each non-empty result
+        as soon as it is scraped.
+        """
+        tabs = min(tabs, len(listing_urls))
+        if self.use_compliance_delays or tabs <= 1:
+            results = []
+            for url in listing_urls:
+                results.append(self.scrape_listing(url))
+                if on_listing and results[-1]:
+                    on_listing(results[-1])
+            return results
+        
+        main_handle = self.driver.current_window_handle
+        handles = [main_handle]
+        results = []
+        try:
+            for _ in range(tabs - 1):
+                self.driver.switch_to.new_window('tab')
+                handles.append(self.driver.current_window_handle)
+            for start in range(0, len(listing_urls), tabs):
+                batch = list(zip(handles, listing_urls[start:start + tabs]))
+                # Start every tab's navigation (returns immediately) so the page loads overlap.
+                # The flag marks the old document; it is gone once the new page has replaced it.
+                failed = set()
+                for handle, url in batch:
+                    try:
+                        _throttle(url)
+                        self.driver.switch_to.window(handle)
+                        self.driver.execute_script("window.__harajStale = true; window.location.href = arguments[0];", url)
+                    except Exception as e:
+                        # The tab still shows its previous listing; never read it as this URL
+                        failed.add(handle)
+                        logger.error("Error loading %s: %s", url, e)
+                # ...then read each tab once its content has rendered
+                for handle, url in batch:
+                    if handle in failed:
+                        self.listing_count += 1
+                        results.append({})
+                        continue
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Scraping: %s", url)
+                    try:
+                        self.driver.switch_to.window(handle)
+                        WebDriverWait(self.driver, 15, poll_frequency=0.05).until(
+                            lambda d: d.execute_script("return !window.__harajStale && document.readyState !== 'loading';")
+                        )
+                        self._wait_for_listing_content()
+                        results.append(self._scrape_loaded_listing(url))
+                    except Exception as e:
+                        self.listing_count += 1
+                        logger.warning("Failed to load page for %s: %s", url, e)
+                        results.append({})
+                    if on_listing and results[-1]:
+                        on_listing(results[-1])
+        finally:
+            for handle in handles[1:]:
+                try:
+                    self.driver.switch_to.window(handle)
+                    self.driver.close()
+                except Exception:
+                    pass
+            try:
+                self.driver.switch_to.window(main_handle)
+            except Exception:
+                pass
+        return results
+    
+    def _scrape_loaded_listing(self, listing_url: str) -> Dict:
+        """Extract details (and download images) for the listing loaded in the current tab."""
+        listing_data = self.extract_listing_details(None, listing_url)
         
         # Validate that we got at least some data
         if not listing_data.get('listing_id') and not listing_data.get('title'):
-            print(f"  Warning: No data extracted from {listing_url}")
+            logger.warning("No data extracted from %s", listing_url)
             # Try to get at least the URL
             listing_data['url'] = listing_url
             listing_data['listing_id'] = self.extract_listing_id(listing_url)
         
         # Download images if enabled
         if self.download_images and listing_data.get('images'):
-            downloaded_images = []
-            for idx, img_url in enumerate(listing_data['images']):
-                local_path = self.download_image(img_url, listing_data.get('listing_id', 'unknown'), idx)
-                if local_path:
-                    downloaded_images.append({
-                        'url': img_url,
-                        'local_path': local_path
-                    })
-                # With login: 0.5-1.5s between image downloads. Without: fast.
-                if self.use_compliance_delays:
+            images = listing_data['images']
+            listing_id = listing_data.get('listing_id', 'unknown')
+            if self.use_compliance_delays:
+                # With login: one at a time, 0.5-1.5s between image downloads (ToS)
+                local_paths = []
+                for idx, img_url in enumerate(images):
+                    local_paths.append(self.download_image(img_url, listing_id, idx))
                     time.sleep(random.uniform(0.5, 1.5))
-                else:
-                    time.sleep(random.uniform(0.05, 0.15))
+            else:
+                # Without login: download in parallel over the pooled session
+                local_paths = list(self._image_executor().map(
+                    self.download_image, images, [listing_id] * len(images), range(len(images))
+                ))
             
-            listing_data['downloaded_images'] = downloaded_images
+            listing_data['downloaded_images'] = [
+                {'url': img_url, 'local_path': local_path}
+                for img_url, local_path in zip(images, local_paths)
+                if local_path
+            ]
         
         # Increment counter
         self.listing_count += 1
@@ -990,52 +1474,35 @@ class HarajScraperSelenium:
         return listing_data
     
     def _extract_listing_links_from_page(self, seen: set) -> List[str]:
-        """Extract listing URLs from current page. Haraj format: /1234567890/title-slug/ (8+ digit ID)."""
+        """Extract listing URLs from current page not yet in ``seen`` (which is updated). Haraj format: /1234567890/title-slug/ (8+ digit ID)."""
         page_urls = []
-        # Match haraj.com.sa with numeric ID (8+ digits) – Haraj uses long IDs
-        listing_pattern = re.compile(
-            r'https?://(?:www\.)?haraj\.com\.sa/(\d{8,})/',
-            re.IGNORECASE
-        )
-        skip_paths = ('/city/', '/users/', '/tags/', '/search/', '/post', '/sitemap', '/en/')
-        all_links = self.driver.find_elements(By.TAG_NAME, "a")
-        for link in all_links:
-            try:
-                href = link.get_attribute('href')
-                if not href or 'haraj.com.sa' not in href:
-                    continue
-                if any(s in href for s in skip_paths):
-                    continue
-                if not listing_pattern.search(href):
-                    continue
-                # Normalize: ensure trailing slash, strip fragment and query
-                clean = href.split('#')[0].split('?')[0].strip()
-                if not clean.endswith('/'):
-                    clean = clean + '/'
-                if clean not in seen:
-                    seen.add(clean)
-                    page_urls.append(clean)
-            except Exception:
-                continue
+        # Listing-shaped hrefs only, filtered and de-duplicated in the page (one round trip, small payload)
+        try:
+            hrefs = self.driver.execute_script(
+                _LISTING_LINKS_JS, _LISTING_URL_RE.pattern, list(_LISTING_LINK_SKIP_PATHS)
+            ) or []
+        except Exception:
+            return page_urls
+        for href in hrefs:
+            # Normalize: ensure trailing slash, strip fragment and query
+            clean = href.split('#')[0].split('?')[0].strip()
+            if not clean.endswith('/'):
+                clean = clean + '/'
+            if clean not in seen:
+                seen.add(clean)
+                page_urls.append(clean)
         return page_urls
 
     def _click_view_more_if_present(self) -> bool:
         """Click 'مشاهدة المزيد' (View more) button if present. Returns True if clicked."""
         try:
-            view_more_selectors = [
-                "//a[contains(text(), 'مشاهدة المزيد')]",
-                "//button[contains(text(), 'مشاهدة المزيد')]",
-                "//*[contains(text(), 'مشاهدة المزيد') and (self::a or self::button or @role='button')]",
-            ]
-            for xpath in view_more_selectors:
-                els = self.driver.find_elements(By.XPATH, xpath)
-                for el in els:
-                    if el.is_displayed() and el.is_enabled():
-                        self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", el)
-                        time.sleep(0.3)
-                        el.click()
-                        time.sleep(1.2 if self.use_compliance_delays else 0.6)
-                        return True
+            # Find, visibility-check and scroll in one round trip; this runs every scroll round
+            el = self.driver.execute_script(_VIEW_MORE_JS, _VIEW_MORE_XPATHS)
+            if el:
+                time.sleep(0.3)
+                el.click()
+                time.sleep(1.2 if self.use_compliance_delays else 0.6)
+                return True
         except Exception:
             pass
         return False
@@ -1044,7 +1511,8 @@ class HarajScraperSelenium:
         """Find listing URLs from category. Scrolls and clicks 'View more' until we have target_count URLs or max_pages."""
         listing_urls = []
         seen = set()
-        time.sleep(random.uniform(0.8, 1.5))
+        if self.use_compliance_delays:
+            time.sleep(random.uniform(0.8, 1.5))
 
         for page in range(1, max_pages + 1):
             if page == 1:
@@ -1052,24 +1520,17 @@ class HarajScraperSelenium:
             else:
                 url = f"{category_url}&page={page}" if '?' in category_url else f"{category_url}?page={page}"
 
-            print(f"Fetching page {page}...")
+            logger.info("Fetching page %s...", page)
             try:
+                if not self.use_compliance_delays:
+                    _throttle(url)
                 self.driver.get(url)
                 if self.use_compliance_delays:
                     time.sleep(random.uniform(2, 4))
-                else:
-                    time.sleep(random.uniform(1.0, 1.5))
             except Exception as e:
-                print(f"Error loading page {page}: {e}")
+                logger.error("Error loading page %s: %s", page, e)
                 break
 
-            try:
-                WebDriverWait(self.driver, 8).until(
-                    EC.presence_of_element_located((By.TAG_NAME, "body"))
-                )
-            except Exception:
-                pass
-
             # On page 1: scroll and click "مشاهدة المزيد" until we have enough URLs or no more button
             page_urls = []
             scroll_rounds = max(25, (target_count or 20)) if page == 1 else 5
@@ -1084,8 +1545,6 @@ class HarajScraperSelenium:
 
                 page_urls = self._extract_listing_links_from_page(seen)
                 listing_urls.extend(page_urls)
-                if page_urls:
-                    seen.update(page_urls)
 
                 if target_count and len(listing_urls) >= target_count:
                     break
@@ -1093,15 +1552,11 @@ class HarajScraperSelenium:
                 page_urls = self._extract_listing_links_from_page(seen)
                 listing_urls.extend(page_urls)
 
-            # Dedupe while preserving order
-            listing_urls = list(dict.fromkeys(listing_urls))
-            seen.update(listing_urls)
-
-            print(f"Page {page}: total {len(listing_urls)} URLs")
+            logger.info("Page %s: total %s URLs", page, len(listing_urls))
 
             if target_count and len(listing_urls) >= target_count:
                 listing_urls = listing_urls[:target_count]
-                print(f"Reached target {target_count} URLs.")
+                logger.info("Reached target %s URLs.", target_count)
                 return listing_urls
 
             if not page_urls and page > 1:
@@ -1116,113 +1571,257 @@ class HarajScraperSelenium:
                 page_urls = self._extract_listing_links_from_page(seen)
                 listing_urls.extend(page_urls)
                 if page_urls:
-                    print(f"After extra scroll: {len(page_urls)} more (total: {len(listing_urls)})")
+                    logger.info("After extra scroll: %s more (total: %s)", len(page_urls), len(listing_urls))
                 if not listing_urls:
                     break
 
             if self.use_compliance_delays:
                 time.sleep(random.uniform(2, 4))
-            else:
-                time.sleep(random.uniform(0.3, 0.6))
 
         if target_count and len(listing_urls) > target_count:
             listing_urls = listing_urls[:target_count]
         return listing_urls
     
-    def scrape_category(self, category_url: str, max_listings: int = 50, max_pages: int = 10) -> List[Dict]:
-        """Scrape all listings from a category"""
-        print(f"Scraping category: {category_url}")
+    def scrape_category(self, category_url: str, max_listings: int = 50, max_pages: int = 10,
+                        workers: int = 1) -> List[Dict]:
+        """Scrape all listings from a category (workers > 1: that many browsers in parallel, no-login only)"""
+        logger.info("Scraping category: %s", category_url)
+        
+        listing_urls = self._category_listing_urls(category_url, max_listings, max_pages)
+        return [listing_data for listing_data in self._scrape_urls(listing_urls, workers) if listing_data]
+    
+    def scrape_category_to_files(self, category_url: str, max_listings: int = 50, max_pages: int = 10,
+                                 workers: int = 1, csv_filename: Optional[str] = "listings.csv",
+                                 jsonl_filename: str = "listings.jsonl",
+                                 json_filename: Optional[str] = "listings.json") -> int:
+        """
+        Like scrape_category(), but each listing is written out as soon as it is scraped (CSV row and
+        one JSON object per line in `jsonl_filename`) and none are kept in memory: URLs go through in
+        rounds of STREAM_CHUNK, so a run that dies keeps what it got. At the end `json_filename` is
+        built from the NDJSON file (same JSON array save_to_json() writes). Returns the number written.
+        """
+        logger.info("Scraping category: %s", category_url)
+        listing_urls = self._category_listing_urls(category_url, max_listings, max_pages)
         
+        written = 0
+        csv_file = csv_writer = None
+        jsonl_path = self.output_dir / jsonl_filename
+        jsonl_file = open(jsonl_path, 'wb')
+        try:
+            if csv_filename:
+                csv_file, csv_writer = self._open_csv_writer(csv_filename)
+            
+            def write_listing(listing: Dict):
+                nonlocal written
+                written += 1
+                if csv_writer:
+                    csv_writer.writerow(self._listing_row(listing))
+                    csv_file.flush()
+                jsonl_file.write(_json_bytes(listing) + b'\n')
+                jsonl_file.flush()
+            
+            for start in range(0, len(listing_urls), STREAM_CHUNK):
+                self._scrape_urls(listing_urls[start:start + STREAM_CHUNK], workers, on_listing=write_listing)
+        finally:
+            for f in (csv_file, jsonl_file):
+                if f:
+                    f.close()
+        if json_filename:
+            self._json_array_from_lines(jsonl_path, json_filename)
+        return written
+    
+    def _category_listing_urls(self, category_url: str, max_listings: int, max_pages: int) -> List[str]:
+        """Up to max_listings listing URLs found on the category pages."""
         listing_urls = self.find_listing_urls(category_url, max_pages=max_pages, target_count=max_listings)
         listing_urls = listing_urls[:max_listings]
+        logger.info("Found %s listings to scrape", len(listing_urls))
+        return listing_urls
+    
+    def _scrape_urls(self, listing_urls: List[str], workers: int,
+                     on_listing: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """scrape_listings_parallel() when workers > 1 may be used (no login), else scrape_listings()."""
+        if workers > 1 and not self.use_compliance_delays and len(listing_urls) > 1:
+            return self.scrape_listings_parallel(listing_urls, workers=workers, on_listing=on_listing)
+        return self.scrape_listings(listing_urls, on_listing=on_listing)
+    
+    def _json_array_from_lines(self, jsonl_path: Path, filename: str):
+        """Write `filename` as a JSON array of the NDJSON file's records, copying lines (never all in memory)."""
+        filepath = self.output_dir / filename
+        tmp = filepath.with_name(filepath.name + '.tmp')
+        with open(jsonl_path, 'rb') as src, open(tmp, 'wb') as dst:
+            dst.write(b'[')
+            sep = b'\n'
+            for line in src:
+                line = line.strip()
+                if line:
+                    dst.write(sep + line)
+                    sep = b',\n'
+            dst.write(b'\n]\n')
+        # Readers (the dashboard) never see a half-written file
+        os.replace(tmp, filepath)
+        logger.info("Data saved to %s", filepath)
+    
+    def scrape_listings_parallel(self, listing_urls: List[str], workers: int = 4,
+                                 on_listing: Optional[Callable[[Dict], None]] = None) -> List[Dict]:
+        """
+        Scrape listings with `workers` browsers at once: this scraper's own driver plus drivers
+        borrowed from the process-wide BrowserPool. The worker scrapers (and their drivers) are set
+        up on first use and reused by later calls until close(). Returns one dict per URL, in order.
+        `on_listing` is called (one call at a time, in completion order) with each non-empty result.
+        """
+        workers = max(1, min(workers, len(listing_urls)))
+        if workers > 1:
+            pool = get_browser_pool(size=workers - 1, headless=self.headless)
+            # The pool keeps the size it was first created with; more workers would wait on acquire() forever
+            if workers > pool.size + 1:
+                logger.warning("Browser pool has %s drivers; using %s workers instead of %s",
+                               pool.size, pool.size + 1, workers)
+                workers = pool.size + 1
+            self._workers.extend([None] * (workers - 1 - len(self._workers)))
         
-        print(f"Found {len(listing_urls)} listings to scrape")
-        
-        all_listings = []
-        for idx, url in enumerate(listing_urls, 1):
-            print(f"\n[{idx}/{len(listing_urls)}]")
-            listing_data = self.scrape_listing(url)
-            if listing_data:
-                all_listings.append(listing_data)
+        if on_listing is not None:
+            emit, emit_lock = on_listing, threading.Lock()
             
-            # Minimal delay between listings for maximum speed
-            if idx < len(listing_urls):
-                time.sleep(random.uniform(0.1, 0.3))  # Ultra fast
+            def on_listing(listing: Dict):
+                with emit_lock:
+                    emit(listing)
+        
+        def run(worker: int) -> List[Dict]:
+            urls = listing_urls[worker::workers]
+            if worker == 0:
+                return self.scrape_listings(urls, on_listing=on_listing)
+            scraper = self._workers[worker - 1]
+            if scraper is None:
+                scraper = self._workers[worker - 1] = HarajScraperSelenium(
+                    output_dir=str(self.output_dir), download_images=self.download_images,
+                    headless=self.headless, pool=pool)
+            try:
+                return scraper.scrape_listings(urls, on_listing=on_listing)
+            except Exception:
+                # Its browser may be dead: hand it back and start a fresh worker next call
+                self._workers[worker - 1] = None
+                scraper.close()
+                raise
         
-        return all_listings
+        results = [{}] * len(listing_urls)
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='haraj-listing') as executor:
+            futures = [executor.submit(run, worker) for worker in range(workers)]
+            for worker, future in enumerate(futures):
+                # One crashed browser only loses its own slice (left as {}), not the other workers' results
+                try:
+                    results[worker::workers] = future.result()
+                except Exception as e:
+                    logger.error("Listing worker %s failed: %s", worker, e)
+        return results
     
     def save_to_json(self, data: List[Dict], filename: str = "listings.json"):
         """Save scraped data to JSON file"""
         filepath = self.output_dir / filename
-        with open(filepath, 'w', encoding='utf-8') as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print(f"\nData saved to {filepath}")
+        tmp = filepath.with_name(filepath.name + '.tmp')
+        with open(tmp, 'wb') as f:
+            f.write(_json_bytes(data, indent=True))
+        # Readers (the dashboard mmaps listings.json) never see a half-written or truncated file
+        os.replace(tmp, filepath)
+        logger.info("Data saved to %s", filepath)
     
     def save_to_csv(self, data: List[Dict], filename: str = "listings.csv"):
         """Save scraped data to CSV file with contact information"""
         if not data:
             return
         
-        filepath = self.output_dir / filename
+        f, writer = self._open_csv_writer(filename)
+        with f:
+            writer.writerows(self._listing_row(listing) for listing in data)
+        
+        logger.info("CSV saved to %s", self.output_dir / filename)
+    
+    def _open_csv_writer(self, filename: str):
+        """Create `filename` in the output dir with the CSV header written; returns (file, writer)"""
         fieldnames = [
             'listing_id', 'title', 'description', 'price', 'city', 'location',
             'posted_time', 'seller_name', 'seller_url', 'category',
             'url', 'image_count', 'tags',
             'phone_number', 'whatsapp_number', 'email'
         ]
+        f = open(self.output_dir / filename, 'w', newline='', encoding='utf-8-sig')
+        # Rows come from _listing_row() with exactly these keys; skip DictWriter's per-row key check
+        writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+        writer.writeheader()
+        return f, writer
+    
+    def _listing_row(self, listing: Dict) -> Dict:
+        """Flatten one listing (contact info included) into a CSV row"""
+        # Extract contact information
+        contact_info = listing.get('contact_info', {})
+        phone_numbers = contact_info.get('phone_numbers', [])
+        phone_number = ', '.join(phone_numbers) if phone_numbers else ''
         
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            writer = csv.DictWriter(f, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for listing in data:
-                # Extract contact information
-                contact_info = listing.get('contact_info', {})
-                phone_numbers = contact_info.get('phone_numbers', [])
-                phone_number = ', '.join(phone_numbers) if phone_numbers else ''
-                
-                # Extract WhatsApp number from link
-                whatsapp_number = ''
-                whatsapp_link = contact_info.get('whatsapp_link', '')
-                if whatsapp_link:
-                    # Extract phone from WhatsApp link (e.g., wa.me/966501234567 or whatsapp://send?phone=966501234567)
-                    whatsapp_match = re.search(r'(?:wa\.me/|whatsapp.*phone=)(\d+)', whatsapp_link)
-                    if whatsapp_match:
-                        whatsapp_number = whatsapp_match.group(1)
-                        # Remove country code if present
-                        if whatsapp_number.startswith('966') and len(whatsapp_number) > 9:
-                            whatsapp_number = whatsapp_number[3:]
-                
-                # Extract email
-                emails = contact_info.get('emails', [])
-                email = ', '.join(emails) if emails else ''
-                
-                row = {
-                    'listing_id': listing.get('listing_id', ''),
-                    'title': listing.get('title', ''),
-                    'description': listing.get('description', ''),
-                    'price': listing.get('price', ''),
-                    'city': listing.get('city', ''),
-                    'location': listing.get('location', ''),
-                    'posted_time': listing.get('posted_time', ''),
-                    'seller_name': listing.get('seller_name', ''),
-                    'seller_url': listing.get('seller_url', ''),
-                    'category': listing.get('category', ''),
-                    'url': listing.get('url', ''),
-                    'image_count': len(listing.get('images', [])),
-                    'tags': ', '.join(listing.get('tags', [])),
-                    'phone_number': phone_number,
-                    'whatsapp_number': whatsapp_number,
-                    'email': email
-                }
-                writer.writerow(row)
+        # Extract WhatsApp number from link
+        whatsapp_number = ''
+        whatsapp_link = contact_info.get('whatsapp_link', '')
+        if whatsapp_link:
+            # Extract phone from WhatsApp link (e.g., wa.me/966501234567 or whatsapp://send?phone=966501234567)
+            whatsapp_match = _WHATSAPP_PHONE_RE.search(whatsapp_link)
+            if whatsapp_match:
+                whatsapp_number = whatsapp_match.group(1)
+                # Remove country code if present
+                if whatsapp_number.startswith('966') and len(whatsapp_number) > 9:
+                    whatsapp_number = whatsapp_number[3:]
+        
+        # Extract email
+        emails = contact_info.get('emails', [])
+        email = ', '.join(emails) if emails else ''
         
-        print(f"CSV saved to {filepath}")
+        return {
+            'listing_id': listing.get('listing_id', ''),
+            'title': listing.get('title', ''),
+            'description': listing.get('description', ''),
+            'price': listing.get('price', ''),
+            'city': listing.get('city', ''),
+            'location': listing.get('location', ''),
+            'posted_time': listing.get('posted_time', ''),
+            'seller_name': listing.get('seller_name', ''),
+            'seller_url': listing.get('seller_url', ''),
+            'category': listing.get('category', ''),
+            'url': listing.get('url', ''),
+            'image_count': len(listing.get('images', [])),
+            'tags': ', '.join(listing.get('tags', [])),
+            'phone_number': phone_number,
+            'whatsapp_number': whatsapp_number,
+            'email': email
+        }
     
     def close(self):
-        """Close the browser"""
-        if self.driver:
-            self.driver.quit()
+        """Close the browser (or hand it back to the pool it came from), and any parallel workers"""
+        workers, self._workers = self._workers, []
+        for worker in workers:
+            if worker is not None:
+                worker.close()
+        if self._image_pool is not None:
+            self._image_pool.shutdown(wait=True)
+            self._image_pool = None
+        with _image_meta_lock:
+            if self._image_meta_path is not None:
+                entry = _image_meta_dbs[self._image_meta_path]
+                entry[1] -= 1
+                if entry[1] == 0:
+                    entry[0].close()
+                    del _image_meta_dbs[self._image_meta_path]
+                self._image_meta_path = None
+        driver, self.driver = self.driver, None
+        if not driver:
+            return
+        if self._pool is not None:
+            self._pool.release(driver, served=self.listing_count)
+        elif self._owns_driver:
+            driver.quit()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+        return False
 
 
 def main():
@@ -1237,9 +1836,17 @@ def main():
     parser.add_argument('--no-images', action='store_true', help='Skip downloading images')
     parser.add_argument('--output-dir', type=str, default='scraped_data', help='Output directory')
     parser.add_argument('--no-headless', action='store_true', help='Run browser in visible mode')
+    parser.add_argument('--workers', type=int, default=1, help='Browsers scraping a category in parallel (no login only)')
     
     args = parser.parse_args()
     
+    # Write log lines in batches instead of one stderr write per message:
+    # flushed when 50 records are queued, on any warning, and at exit
+    log_stream = logging.StreamHandler(sys.stderr)
+    log_stream.setFormatter(logging.Formatter('%(message)s'))
+    logging.basicConfig(level=logging.INFO,
+                        handlers=[logging.handlers.MemoryHandler(50, flushLevel=logging.WARNING, target=log_stream)])
+    
     # Initialize scraper
     scraper = HarajScraperSelenium(
         output_dir=args.output_dir,
@@ -1256,16 +1863,15 @@ def main():
                 print("\nScraping completed!")
         
         elif args.category:
-            listings = scraper.scrape_category(
+            count = scraper.scrape_category_to_files(
                 args.category,
                 max_listings=args.max_listings,
-                max_pages=args.max_pages
+                max_pages=args.max_pages,
+                workers=args.workers
             )
             
-            if listings:
-                scraper.save_to_json(listings, "listings.json")
-                scraper.save_to_csv(listings, "listings.csv")
-                print(f"\nScraped {len(listings)} listings successfully!")
+            if count:
+                print(f"\nScraped {count} listings successfully!")
         
         else:
             print("Please provide either --url or --category argument")
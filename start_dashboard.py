@@ -14,7 +14,7 @@ if not Path("templates/dashboard.html").exists():
     sys.exit(1)
 
 try:
-    from dashboard import app
+    from dashboard import app, warm_up
 except Exception as e:
     print(f"✗ ERROR loading dashboard: {e}")
     import traceback
@@ -56,6 +56,7 @@ if __name__ == '__main__':
     print("Press Ctrl+C to stop the server")
     print("=" * 70 + "\n")
     
+    warm_up()
     try:
         app.run(debug=True, host='0.0.0.0', port=5000, use_reloader=False)
     except OSError as e: